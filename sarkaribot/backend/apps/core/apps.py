@@ -13,5 +13,6 @@ class CoreConfig(AppConfig):
     verbose_name = 'Core'
     
     def ready(self):
-        """Import signal handlers when the app is ready."""
+        """Import signal handlers and system checks when the app is ready."""
+        import apps.core.checks  # noqa
         import apps.core.signals  # noqa
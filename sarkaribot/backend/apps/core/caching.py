@@ -0,0 +1,113 @@
+"""
+Response caching for API viewsets.
+
+List and aggregate responses are cached under per-model version numbers
+that are bumped whenever a row of that model is saved or deleted (see
+each app's signals.py), so cached responses are dropped as soon as the
+underlying data changes. Keys are prefixed with the model's app label.
+"""
+
+import hashlib
+import time
+
+from django.core.cache import cache
+from rest_framework.response import Response
+
+# Upper bound on staleness for writes that bypass model signals
+# (queryset.update(), bulk_create, bulk_update)
+LIST_CACHE_TIMEOUT = 60 * 5
+
+# Aggregate endpoints (stats, trending, summary) are refreshed more often
+AGGREGATE_CACHE_TIMEOUT = 60
+
+
+def _version_key(model) -> str:
+    """Cache key holding the current list cache version for a model."""
+    return f"{model._meta.app_label}:list-version:{model._meta.label_lower}"
+
+
+def get_list_cache_version(model) -> int:
+    """
+    Get the current list cache version for a model.
+
+    Args:
+        model: Django model class
+
+    Returns:
+        Version number, 0 if the model has never been invalidated
+    """
+    return cache.get(_version_key(model), 0)
+
+
+def invalidate_list_cache(model) -> None:
+    """
+    Invalidate every cached list response for a model.
+
+    Args:
+        model: Django model class
+    """
+    cache.set(_version_key(model), time.time_ns(), None)
+
+
+class CachedResponseMixin:
+    """
+    ViewSet mixin for caching aggregate action responses.
+
+    The key covers the list cache version of every model in cache_models
+    (the viewset's own model by default) and the full request path, so
+    filters and query parameters are cached independently.
+    """
+
+    list_cache_timeout = LIST_CACHE_TIMEOUT
+
+    # Models whose changes invalidate this viewset's cached responses
+    cache_models = ()
+
+    def _response_cache_key(self, request, name: str) -> str:
+        """Build the cache key for one endpoint of this viewset."""
+        model = self.queryset.model
+        versions = ':'.join(
+            str(get_list_cache_version(cache_model))
+            for cache_model in (self.cache_models or (model,))
+        )
+        path_hash = hashlib.md5(request.get_full_path().encode('utf-8')).hexdigest()
+        return f"{model._meta.app_label}:{name}:{model._meta.label_lower}:{versions}:{path_hash}"
+
+    def get_cached_data(self, request, name: str, build, timeout: int = None):
+        """
+        Return cached data for an aggregate action, building it on a miss.
+
+        Args:
+            request: Current request
+            name: Endpoint name used in the cache key
+            build: Callable returning picklable response data
+            timeout: Cache timeout in seconds, defaults to list_cache_timeout
+
+        Returns:
+            Cached or freshly built response data
+        """
+        cache_key = self._response_cache_key(request, name)
+        data = cache.get(cache_key)
+        if data is None:
+            data = build()
+            cache.set(cache_key, data, timeout or self.list_cache_timeout)
+        return data
+
+
+class CachedListMixin(CachedResponseMixin):
+    """
+    ViewSet mixin that also serves list responses from the cache.
+
+    Search, ordering and pagination parameters are part of the key.
+    """
+
+    def list(self, request, *args, **kwargs):
+        cache_key = self._response_cache_key(request, 'list')
+
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)
+        cache.set(cache_key, response.data, self.list_cache_timeout)
+        return response
@@ -0,0 +1,32 @@
+"""
+System checks for SarkariBot.
+"""
+
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+from django.utils.module_loading import import_string
+
+
+@register(Tags.compatibility, deploy=True)
+def check_async_capable_middleware(app_configs, **kwargs):
+    """
+    Require every middleware to be async-capable for ASGI deployments.
+
+    Under ASGI, each sync-only middleware in the chain makes Django adapt
+    the handler with sync_to_async/async_to_sync, costing a thread hop
+    per request. Runs with ``manage.py check --deploy``.
+
+    Returns:
+        List of errors, one per sync-only middleware
+    """
+    errors = []
+    for path in settings.MIDDLEWARE:
+        middleware = import_string(path)
+        if not getattr(middleware, 'async_capable', False):
+            errors.append(Error(
+                f"Middleware '{path}' is not async-capable.",
+                hint="Use an async-capable release or remove it from production MIDDLEWARE.",
+                obj=path,
+                id='core.E001',
+            ))
+    return errors
@@ -0,0 +1,42 @@
+"""
+Custom model fields for SarkariBot.
+"""
+
+import json
+import zlib
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+# zlib level used for new writes; 6 is zlib's own speed/size default
+COMPRESSION_LEVEL = 6
+
+
+class CompressedJSONField(models.BinaryField):
+    """
+    JSON value stored zlib-compressed in a binary column.
+
+    Meant for large, write-heavy payloads that are only read back whole,
+    such as audit details. Compressing before the INSERT shrinks the row,
+    the WAL record and the TOAST table, at the cost of not being able to
+    filter on the JSON contents in SQL.
+    """
+
+    def get_prep_value(self, value):
+        if value is None:
+            return None
+        encoded = json.dumps(value, cls=DjangoJSONEncoder, separators=(',', ':'))
+        return zlib.compress(encoded.encode('utf-8'), COMPRESSION_LEVEL)
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return None
+        return json.loads(zlib.decompress(value))
+
+    def to_python(self, value):
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
+
+    def value_to_string(self, obj):
+        return json.dumps(self.value_from_object(obj), cls=DjangoJSONEncoder)
@@ -0,0 +1,85 @@
+"""
+Logging handlers for SarkariBot.
+
+Referenced from the LOGGING setting, so this module must not import
+anything that needs the app registry.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+
+class BackgroundFileHandler(QueueHandler):
+    """
+    File handler that writes from a background thread.
+
+    Records are put on an in-memory queue and written by a QueueListener
+    that owns the real FileHandler, so request and scraper threads never
+    block on disk I/O. The listener is started lazily in each process,
+    which keeps it working in forked Gunicorn and Celery workers, and is
+    stopped at exit after draining the queue.
+    """
+
+    def __init__(self, filename, mode: str = 'a', encoding: str = None):
+        """
+        Initialize the handler.
+
+        Args:
+            filename: Path of the log file
+            mode: File open mode
+            encoding: File encoding, platform default when None
+        """
+        super().__init__(queue.SimpleQueue())
+        self.file_handler = logging.FileHandler(filename, mode=mode, encoding=encoding, delay=True)
+        self._listener = None
+        self._listener_pid = None
+        self._listener_lock = threading.Lock()
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    def _reset_after_fork(self) -> None:
+        """Drop the parent's queue, lock and listener in a forked child."""
+        # Records still queued in the parent are written by the parent
+        self.queue = queue.SimpleQueue()
+        self._listener = None
+        self._listener_pid = None
+        self._listener_lock = threading.Lock()
+
+    def setFormatter(self, fmt):
+        # Records are formatted by the file handler on the listener thread;
+        # prepare() only merges the message arguments and traceback
+        self.file_handler.setFormatter(fmt)
+
+    def _ensure_listener(self) -> None:
+        """Start the listener thread if this process does not have one."""
+        pid = os.getpid()
+        if self._listener_pid == pid:
+            return
+
+        with self._listener_lock:
+            if self._listener_pid != pid:
+                self._listener = QueueListener(self.queue, self.file_handler)
+                self._listener.start()
+                self._listener_pid = pid
+                atexit.register(self._stop_listener)
+
+    def _stop_listener(self) -> None:
+        """Write out queued records and stop the listener thread."""
+        with self._listener_lock:
+            if self._listener is not None and self._listener_pid == os.getpid():
+                self._listener.stop()
+                self._listener = None
+                self._listener_pid = None
+
+    def enqueue(self, record):
+        self._ensure_listener()
+        super().enqueue(record)
+
+    def close(self):
+        self._stop_listener()
+        self.file_handler.close()
+        super().close()
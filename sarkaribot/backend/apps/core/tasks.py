@@ -10,7 +10,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-@shared_task(bind=True, max_retries=3)
+@shared_task(bind=True, max_retries=3, acks_late=False)
 def health_check(self):
     """
     Periodic health check task.
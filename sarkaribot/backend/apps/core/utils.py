@@ -4,6 +4,7 @@ Core utilities and helper functions for SarkariBot.
 
 import re
 import logging
+import functools
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from django.utils.text import slugify
@@ -292,6 +293,45 @@ def get_financial_year(date: Optional[datetime] = None) -> str:
     return f"{start_year}-{str(end_year)[-2:]}"
 
 
+def safe_signal(name: str):
+    """
+    Decorator that shields a signal receiver from its own failures.
+
+    Exceptions are logged once with a consistent structured record instead
+    of each handler carrying its own try/except block, so a failing side
+    effect never aborts the save that triggered it.
+
+    Args:
+        name: Handler name recorded in the log record
+
+    Returns:
+        Decorator wrapping the receiver function
+
+    Usage:
+        @receiver(post_save, sender=JobPosting)
+        @safe_signal('trigger_instant_alerts')
+        def trigger_instant_alerts(sender, instance, **kwargs):
+            ...
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                instance = kwargs.get('instance')
+                logger.exception(
+                    f"Signal handler {name} failed",
+                    extra={
+                        'handler': name,
+                        'instance_id': getattr(instance, 'pk', None),
+                    }
+                )
+                return None
+        return wrapper
+    return decorator
+
+
 class PerformanceMonitor:
     """
     Context manager for monitoring function performance.
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.14 on 2026-10-17 10:00
+
+from django.db import migrations, models
+
+
+def backfill_seo_quality(apps, schema_editor):
+    """Compute seo_quality for existing job postings."""
+    JobPosting = apps.get_model('jobs', 'JobPosting')
+
+    flagged = []
+    for job in JobPosting.objects.only('id', 'seo_title', 'seo_description', 'keywords').iterator(chunk_size=1000):
+        quality = 0
+        if not 40 <= len(job.seo_title) <= 60:
+            quality |= 1
+        if not 140 <= len(job.seo_description) <= 160:
+            quality |= 2
+        if not job.keywords:
+            quality |= 4
+        if quality:
+            job.seo_quality = quality
+            flagged.append(job)
+
+    JobPosting.objects.bulk_update(flagged, ['seo_quality'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0002_jobposting_breadcrumbs_jobposting_canonical_url_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobposting',
+            name='seo_quality',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Bit flags for SEO metadata problems (0 = optimal)'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(condition=models.Q(('seo_quality', 0), _negated=True), fields=['seo_quality'], name='jobs_seo_quality_flagged_idx'),
+        ),
+        migrations.RunPython(backfill_seo_quality, migrations.RunPython.noop),
+    ]
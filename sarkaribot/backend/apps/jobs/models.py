@@ -89,6 +89,11 @@ class JobPosting(TimestampedModel):
         ('urgent', 'Urgent'),
     ]
     
+    # seo_quality bit flags; 0 means the SEO metadata meets every target
+    SEO_QUALITY_TITLE_LENGTH = 1
+    SEO_QUALITY_DESCRIPTION_LENGTH = 2
+    SEO_QUALITY_MISSING_KEYWORDS = 4
+    
     # Core Job Information
     title = models.CharField(
         max_length=255,
@@ -251,6 +256,10 @@ class JobPosting(TimestampedModel):
         default=dict,
         help_text="JSON-LD structured data for search engines"
     )
+    seo_quality = models.PositiveSmallIntegerField(
+        default=0,
+        help_text="Bit flags for SEO metadata problems (0 = optimal)"
+    )
     
     # Additional SEO fields
     canonical_url = models.URLField(
@@ -299,6 +308,11 @@ class JobPosting(TimestampedModel):
             models.Index(fields=['category', 'status', '-published_at']),
             models.Index(fields=['application_end_date']),
             models.Index(fields=['is_featured', 'priority', '-published_at']),
+            models.Index(
+                fields=['seo_quality'],
+                name='jobs_seo_quality_flagged_idx',
+                condition=~models.Q(seo_quality=0),
+            ),
         ]
         verbose_name = 'Job Posting'
         verbose_name_plural = 'Job Postings'
@@ -319,6 +333,8 @@ class JobPosting(TimestampedModel):
         if not self.pk and not self.published_at:
             self.published_at = timezone.now()
         
+        self.seo_quality = self.calculate_seo_quality()
+        
         super().save(*args, **kwargs)
     
     @property
@@ -346,8 +362,48 @@ class JobPosting(TimestampedModel):
     @property
     def is_urgent(self) -> bool:
         """Check if this job posting is urgent (deadline approaching)."""
-        return self.days_remaining <= 7 and self.days_remaining > 0
+        days_remaining = self.days_remaining
+        return 0 < days_remaining <= 7
     
+    def calculate_seo_quality(self) -> int:
+        """
+        Calculate SEO quality flags for the current metadata.
+        
+        Returns:
+            Bitmask of SEO_QUALITY_* flags, 0 when all targets are met
+        """
+        quality = 0
+        if not 40 <= len(self.seo_title) <= 60:
+            quality |= self.SEO_QUALITY_TITLE_LENGTH
+        if not 140 <= len(self.seo_description) <= 160:
+            quality |= self.SEO_QUALITY_DESCRIPTION_LENGTH
+        if not self.keywords:
+            quality |= self.SEO_QUALITY_MISSING_KEYWORDS
+        return quality
+    
+    @property
+    def keyword_list(self) -> list:
+        """
+        Get SEO keywords as a list.
+
+        Reuses the list passed to set_keywords() while the stored string is
+        unchanged, so freshly generated keywords are not split back apart.
+        """
+        cached = self.__dict__.get('_keywords_cache')
+        if cached is not None and cached[0] is self.keywords:
+            return cached[1]
+        return self.keywords.split(', ') if self.keywords else []
+
+    def set_keywords(self, keywords: list):
+        """
+        Store SEO keywords as a comma-separated string.
+
+        Args:
+            keywords: List of keyword strings
+        """
+        self.keywords = ', '.join(keywords)
+        self._keywords_cache = (self.keywords, list(keywords))
+
     def increment_view_count(self):
         """Increment the view count for this job posting."""
         JobPosting.objects.filter(pk=self.pk).update(view_count=models.F('view_count') + 1)
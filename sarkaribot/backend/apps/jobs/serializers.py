@@ -178,7 +178,7 @@ class JobPostingDetailSerializer(serializers.ModelSerializer):
         return {
             'title': obj.seo_title,
             'description': obj.seo_description,
-            'keywords': obj.keywords.split(', ') if obj.keywords else [],
+            'keywords': obj.keyword_list,
             'canonical_url': obj.canonical_url,
             'structured_data': obj.structured_data,
             'meta_tags': obj.meta_tags,
@@ -11,3 +11,7 @@ class ScrapingConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.scraping'
     verbose_name = 'Web Scraping Engine'
+    
+    def ready(self):
+        """Initialize app when Django starts."""
+        import apps.scraping.signals
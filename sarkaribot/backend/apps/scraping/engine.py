@@ -379,12 +379,12 @@ class RequestsScraper(BaseScraper):
             List of job data from this page
         """
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
             
             # Track response time
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
             self.response_times.append(response_time)
             self.requests_made += 1
             
@@ -667,14 +667,14 @@ class PlaywrightScraper(BaseScraper):
             List of job data from this page
         """
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             await page.goto(url, wait_until='networkidle')
             
             # Wait for content to load
             await asyncio.sleep(2)
             
             # Track response time
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
             self.response_times.append(response_time)
             self.requests_made += 1
             
@@ -107,6 +107,18 @@ class ScrapeLog(TimestampedModel):
     def __str__(self) -> str:
         return f"Scrape {self.source.name} - {self.started_at.strftime('%Y-%m-%d %H:%M')}"
     
+    def save(self, *args, **kwargs):
+        """Save the log, recording a new scrape's status on its source."""
+        creating = self._state.adding
+        super().save(*args, **kwargs)
+        if creating:
+            self._record_source_status()
+
+    def _record_source_status(self) -> None:
+        """Copy this log's status to GovernmentSource.last_scrape_status."""
+        from apps.sources.models import GovernmentSource
+        GovernmentSource.objects.filter(pk=self.source_id).update(last_scrape_status=self.status)
+
     def mark_completed(self, jobs_stats: dict) -> None:
         """
         Mark the scrape as completed with final statistics.
@@ -129,6 +141,7 @@ class ScrapeLog(TimestampedModel):
         self.jobs_skipped = jobs_stats.get('skipped', 0)
         
         self.save()
+        self._record_source_status()
     
     def mark_failed(self, error_message: str) -> None:
         """
@@ -147,6 +160,7 @@ class ScrapeLog(TimestampedModel):
             self.duration_seconds = Decimal(str(duration.total_seconds()))
         
         self.save()
+        self._record_source_status()
     
     @property
     def success_rate(self) -> float:
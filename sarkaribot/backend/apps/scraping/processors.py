@@ -14,6 +14,9 @@ from decimal import Decimal
 
 logger = logging.getLogger(__name__)
 
+# Words kept lowercase when title-casing job titles
+_TITLE_MINOR_WORDS = frozenset({'of', 'for', 'and', 'in', 'at', 'to'})
+
 
 class DataProcessor:
     """
@@ -159,7 +162,7 @@ class DataProcessor:
                 break
         
         # Capitalize properly
-        title = ' '.join(word.capitalize() if word.lower() not in ['of', 'for', 'and', 'in', 'at', 'to'] 
+        title = ' '.join(word.capitalize() if word.lower() not in _TITLE_MINOR_WORDS
                         else word.lower() for word in title.split())
         
         # Ensure first word is capitalized
@@ -17,6 +17,13 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# User agents rotated through when a source does not configure its own
+DEFAULT_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+)
+
 
 class BaseScraper(ABC):
     """
@@ -37,7 +44,7 @@ class BaseScraper(ABC):
         self.delay = source_config.get('request_delay', 2)
         self.max_retries = source_config.get('max_retries', 3)
         self.timeout = source_config.get('timeout', 30)
-        self.user_agents = source_config.get('user_agents', [])
+        self.user_agents = tuple(source_config.get('user_agents') or DEFAULT_USER_AGENTS)
         self.scraped_data = []
         self.stats = {
             'pages_scraped': 0,
@@ -72,16 +79,7 @@ class BaseScraper(ABC):
     
     def get_random_user_agent(self) -> str:
         """Get a random user agent string."""
-        if self.user_agents:
-            return random.choice(self.user_agents)
-        
-        # Default user agents if none configured
-        default_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        ]
-        return random.choice(default_agents)
+        return random.choice(self.user_agents)
     
     def add_delay(self):
         """Add random delay between requests."""
@@ -370,7 +368,8 @@ class RateLimiter:
     
     def wait_if_needed(self):
         """Wait if rate limit would be exceeded."""
-        current_time = time.time()
+        # Monotonic clock so wall-clock adjustments cannot skew the window
+        current_time = time.monotonic()
         
         # Remove old requests (older than 1 minute)
         self.request_times = [t for t in self.request_times if current_time - t < 60]
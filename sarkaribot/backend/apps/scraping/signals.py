@@ -0,0 +1,21 @@
+"""
+Django signals for the scraping app.
+"""
+
+from django.db.models.signals import post_save, post_delete
+
+from apps.core.utils import safe_signal
+from apps.core.caching import invalidate_list_cache
+from .models import SourceStatistics
+
+
+@safe_signal('invalidate_scraping_cache')
+def invalidate_scraping_cache(sender, **kwargs):
+    """
+    Drop cached statistics summaries when a statistics row changes.
+    """
+    invalidate_list_cache(sender)
+
+
+post_save.connect(invalidate_scraping_cache, sender=SourceStatistics)
+post_delete.connect(invalidate_scraping_cache, sender=SourceStatistics)
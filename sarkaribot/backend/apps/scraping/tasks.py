@@ -6,7 +6,7 @@ job data processing, and maintenance operations.
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 from typing import Dict, Any, List
 
 from celery import shared_task
@@ -70,23 +70,8 @@ def scheduled_scraping() -> Dict[str, Any]:
         Dictionary with scheduling results
     """
     try:
-        now = timezone.now()
-        sources_to_scrape = []
-
         # Find sources that need scraping
-        active_sources = GovernmentSource.objects.filter(active=True)
-
-        for source in active_sources:
-            if source.last_scraped is None:
-                # Never scraped before
-                sources_to_scrape.append(source)
-            else:
-                # Check if enough time has passed
-                time_since_last_scrape = now - source.last_scraped
-                scrape_interval = timedelta(hours=source.scrape_frequency)
-
-                if time_since_last_scrape >= scrape_interval:
-                    sources_to_scrape.append(source)
+        sources_to_scrape = GovernmentSource.objects.due_for_scraping().only('id', 'name')
 
         # Schedule scraping tasks
         scheduled_tasks = []
@@ -425,7 +410,6 @@ def cleanup_old_scrape_logs():
     Removes scrape logs older than 30 days and related scraped data.
     """
     from apps.scraping.models import ScrapeLog, ScrapedData
-    from datetime import timedelta
 
     try:
         cutoff_date = timezone.now() - timedelta(days=30)
@@ -460,57 +444,52 @@ def update_source_statistics():
     This task should run daily to calculate and store performance
     metrics for each source.
     """
-    from apps.sources.models import GovernmentSource, SourceStatistics
+    from apps.sources.models import SourceStatistics
     from apps.scraping.models import ScrapeLog
-    from datetime import date, timedelta
-    from django.db.models import Count, Avg
+    from django.db.models import Avg, Count, Q, Sum
 
     try:
         yesterday = date.today() - timedelta(days=1)
 
-        sources = GovernmentSource.objects.all()
-        stats_created = 0
-
-        for source in sources:
-            # Get scraping logs for yesterday
-            logs = ScrapeLog.objects.filter(
-                source=source,
-                started_at__date=yesterday
+        # Aggregate yesterday's scrape logs for every source in one query
+        per_source = (
+            ScrapeLog.objects.filter(started_at__date=yesterday)
+            .values('source_id')
+            .annotate(
+                scrapes_attempted=Count('id'),
+                scrapes_successful=Count('id', filter=Q(status='completed')),
+                scrapes_failed=Count('id', filter=Q(status='failed')),
+                total_jobs_found=Sum('jobs_found'),
+                total_jobs_updated=Sum('jobs_updated'),
+                avg_response_time=Avg('average_response_time'),
+                total_pages=Sum('pages_scraped')
             )
+            .order_by()
+        )
 
-            if logs.exists():
-                # Calculate statistics
-                stats = logs.aggregate(
-                    scrapes_attempted=Count('id'),
-                    scrapes_successful=Count('id', filter=models.Q(status='completed')),
-                    scrapes_failed=Count('id', filter=models.Q(status='failed')),
-                    total_jobs_found=models.Sum('jobs_found'),
-                    total_jobs_created=models.Sum('jobs_created'),
-                    total_jobs_updated=models.Sum('jobs_updated'),
-                    avg_response_time=Avg('average_response_time'),
-                    total_pages=models.Sum('pages_scraped')
-                )
-
-                # Create or update statistics record
-                source_stats, created = SourceStatistics.objects.get_or_create(
-                    source=source,
-                    date=yesterday,
-                    defaults={
-                        'scrapes_attempted': stats['scrapes_attempted'] or 0,
-                        'scrapes_successful': stats['scrapes_successful'] or 0,
-                        'scrapes_failed': stats['scrapes_failed'] or 0,
-                        'jobs_found': stats['total_jobs_found'] or 0,
-                        'jobs_updated': stats['total_jobs_updated'] or 0,
-                        'average_response_time': stats['avg_response_time'],
-                        'total_pages_scraped': stats['total_pages'] or 0
-                    }
-                )
+        rows = [
+            {
+                'source_id': stats['source_id'],
+                'date': yesterday,
+                'scrapes_attempted': stats['scrapes_attempted'] or 0,
+                'scrapes_successful': stats['scrapes_successful'] or 0,
+                'scrapes_failed': stats['scrapes_failed'] or 0,
+                'jobs_found': stats['total_jobs_found'] or 0,
+                'jobs_updated': stats['total_jobs_updated'] or 0,
+                'average_response_time': (
+                    float(stats['avg_response_time'])
+                    if stats['avg_response_time'] is not None else None
+                ),
+                'total_pages_scraped': stats['total_pages'] or 0
+            }
+            for stats in per_source
+        ]
 
-                if created:
-                    stats_created += 1
+        # Create or update statistics records in batched upserts
+        stats_updated = SourceStatistics.objects.bulk_upsert(rows)
 
-        logger.info(f"Updated statistics for {stats_created} sources")
-        return {'statistics_created': stats_created}
+        logger.info(f"Updated statistics for {stats_updated} sources")
+        return {'statistics_updated': stats_updated}
 
     except Exception as e:
         logger.error(f"Statistics update failed: {e}")
@@ -10,7 +10,7 @@ from typing import Dict, Any
 from datetime import datetime, timedelta
 
 from django.shortcuts import get_object_or_404
-from django.db.models import Count, Avg, Q
+from django.db.models import Count, Avg, Q, Sum
 from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
@@ -20,6 +20,7 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 
+from apps.core.caching import CachedResponseMixin
 from .models import ScrapeLog, ScrapedData, SourceStatistics, ScrapingError
 from .serializers import (
     ScrapeLogSerializer,
@@ -33,6 +34,9 @@ from apps.sources.models import GovernmentSource
 
 logger = logging.getLogger(__name__)
 
+# Statistics summaries only change when the daily statistics are rebuilt
+SUMMARY_CACHE_TIMEOUT = 60 * 5
+
 
 class ScrapeLogViewSet(viewsets.ReadOnlyModelViewSet):
     """
@@ -208,7 +212,23 @@ class ScrapedDataViewSet(viewsets.ReadOnlyModelViewSet):
         return Response(analysis)
 
 
-class SourceStatisticsViewSet(viewsets.ReadOnlyModelViewSet):
+def _success_rate(totals: Dict[str, Any]) -> float:
+    """
+    Compute a success percentage from summed scrape counts.
+
+    Args:
+        totals: Mapping with 'attempted' and 'successful' sums (may be None)
+
+    Returns:
+        Success rate in percent, 0.0 when nothing was attempted
+    """
+    attempted = totals.get('attempted') or 0
+    if attempted == 0:
+        return 0.0
+    return (totals.get('successful') or 0) / attempted * 100
+
+
+class SourceStatisticsViewSet(CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for source scraping statistics.
     
@@ -220,7 +240,7 @@ class SourceStatisticsViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['source', 'date']
-    ordering_fields = ['date', 'success_rate', 'jobs_found']
+    ordering_fields = ['date', 'scrapes_successful', 'jobs_found']
     ordering = ['-date']
     
     @action(detail=False, methods=['get'])
@@ -230,60 +250,75 @@ class SourceStatisticsViewSet(viewsets.ReadOnlyModelViewSet):
         
         Returns aggregated performance metrics.
         """
+        summary = self.get_cached_data(
+            request, 'summary', self._build_summary, timeout=SUMMARY_CACHE_TIMEOUT
+        )
+        return Response(summary)
+
+    def _build_summary(self) -> Dict[str, Any]:
+        """Aggregate the last 30 days of statistics with 7-day daily trends."""
         # Date range for analysis
         end_date = timezone.now().date()
         start_date = end_date - timedelta(days=30)  # Last 30 days
         
         queryset = self.get_queryset().filter(date__gte=start_date, date__lte=end_date)
         
-        if not queryset.exists():
-            return Response({'message': 'No statistics data found for the specified period'})
-        
         # Overall statistics
         total_stats = queryset.aggregate(
             total_scrapes=Count('id'),
-            avg_success_rate=Avg('success_rate'),
-            total_jobs_found=models.Sum('jobs_found'),
-            total_jobs_created=models.Sum('jobs_created'),
+            attempted=Sum('scrapes_attempted'),
+            successful=Sum('scrapes_successful'),
+            total_jobs_found=Sum('jobs_found'),
+            total_jobs_created=Sum('jobs_created'),
             avg_response_time=Avg('average_response_time')
         )
+        total_stats['avg_success_rate'] = _success_rate(total_stats)
+        
+        if not total_stats['total_scrapes']:
+            return {'message': 'No statistics data found for the specified period'}
         
-        # Source performance ranking
+        # Source performance ranking, one grouped query over active sources
         source_performance = []
-        for source in GovernmentSource.objects.filter(active=True):
-            source_stats = queryset.filter(source=source)
-            if source_stats.exists():
-                source_metrics = source_stats.aggregate(
-                    avg_success_rate=Avg('success_rate'),
-                    total_jobs=models.Sum('jobs_found'),
-                    avg_jobs_per_scrape=Avg('jobs_found'),
-                    scrape_count=Count('id')
-                )
-                
-                source_performance.append({
-                    'source_name': source.name,
-                    'success_rate': round(source_metrics['avg_success_rate'] or 0, 2),
-                    'total_jobs': source_metrics['total_jobs'] or 0,
-                    'average_jobs_per_scrape': round(source_metrics['avg_jobs_per_scrape'] or 0, 2),
-                    'scrape_frequency': source.scrape_frequency,
-                    'total_scrapes': source_metrics['scrape_count']
-                })
+        source_rows = queryset.filter(source__is_active=True).values(
+            'source__name', 'source__scrape_frequency'
+        ).annotate(
+            attempted=Sum('scrapes_attempted'),
+            successful=Sum('scrapes_successful'),
+            total_jobs=Sum('jobs_found'),
+            avg_jobs_per_scrape=Avg('jobs_found'),
+            scrape_count=Count('id')
+        ).order_by()
+        for row in source_rows:
+            source_performance.append({
+                'source_name': row['source__name'],
+                'success_rate': round(_success_rate(row), 2),
+                'total_jobs': row['total_jobs'] or 0,
+                'average_jobs_per_scrape': round(row['avg_jobs_per_scrape'] or 0, 2),
+                'scrape_frequency': row['source__scrape_frequency'],
+                'total_scrapes': row['scrape_count']
+            })
         
-        # Daily trends (last 7 days)
+        # Daily trends (last 7 days), grouped by date in SQL; days without
+        # statistics are reported as zeros
+        trend_rows = {
+            row['date']: row
+            for row in queryset.filter(date__gt=end_date - timedelta(days=7)).values('date').annotate(
+                scrapes=Count('id'),
+                jobs_found=Sum('jobs_found'),
+                attempted=Sum('scrapes_attempted'),
+                successful=Sum('scrapes_successful')
+            ).order_by()
+        }
         daily_trends = []
         for i in range(7):
             date = end_date - timedelta(days=i)
-            day_stats = queryset.filter(date=date).aggregate(
-                scrapes=Count('id'),
-                jobs_found=models.Sum('jobs_found'),
-                avg_success_rate=Avg('success_rate')
-            )
+            day_stats = trend_rows.get(date, {})
             
             daily_trends.append({
                 'date': date.isoformat(),
-                'scrapes': day_stats['scrapes'] or 0,
-                'jobs_found': day_stats['jobs_found'] or 0,
-                'success_rate': round(day_stats['avg_success_rate'] or 0, 2)
+                'scrapes': day_stats.get('scrapes') or 0,
+                'jobs_found': day_stats.get('jobs_found') or 0,
+                'success_rate': round(_success_rate(day_stats), 2)
             })
         
         summary = {
@@ -294,7 +329,7 @@ class SourceStatisticsViewSet(viewsets.ReadOnlyModelViewSet):
             },
             'overall_statistics': {
                 'total_scrapes': total_stats['total_scrapes'],
-                'average_success_rate': round(total_stats['avg_success_rate'] or 0, 2),
+                'average_success_rate': round(total_stats['avg_success_rate'], 2),
                 'total_jobs_found': total_stats['total_jobs_found'] or 0,
                 'total_jobs_created': total_stats['total_jobs_created'] or 0,
                 'average_response_time': round(total_stats['avg_response_time'] or 0, 3)
@@ -303,7 +338,7 @@ class SourceStatisticsViewSet(viewsets.ReadOnlyModelViewSet):
             'daily_trends': daily_trends
         }
         
-        return Response(summary)
+        return summary
 
 
 class ScrapingControlAPIView(APIView):
@@ -415,28 +450,22 @@ class ScrapingControlAPIView(APIView):
         running_logs = ScrapeLog.objects.filter(status='running')
         
         # Active sources
-        active_sources = GovernmentSource.objects.filter(active=True)
-        
+        active_sources = GovernmentSource.objects.filter(is_active=True)
+
         # Sources that need scraping
+        now = timezone.now()
         sources_needing_scrape = []
-        for source in active_sources:
+        for source in GovernmentSource.objects.due_for_scraping().only('id', 'name', 'last_scraped'):
             if source.last_scraped is None:
-                sources_needing_scrape.append({
-                    'source_id': source.id,
-                    'source_name': source.name,
-                    'reason': 'Never scraped'
-                })
+                reason = 'Never scraped'
             else:
-                time_since_scrape = timezone.now() - source.last_scraped
-                scrape_interval = timedelta(hours=source.scrape_frequency)
-                
-                if time_since_scrape >= scrape_interval:
-                    sources_needing_scrape.append({
-                        'source_id': source.id,
-                        'source_name': source.name,
-                        'reason': f'Last scraped {time_since_scrape} ago'
-                    })
-        
+                reason = f'Last scraped {now - source.last_scraped} ago'
+            sources_needing_scrape.append({
+                'source_id': source.id,
+                'source_name': source.name,
+                'reason': reason
+            })
+
         status_info = {
             'system_status': 'operational',
             'active_sources_count': active_sources.count(),
@@ -513,7 +542,3 @@ def generate_quality_recommendations(quality_dist: Dict, source_quality: list) -
         recommendations.append("Data quality looks good overall. Continue monitoring for improvements.")
     
     return recommendations
-
-
-# Add necessary imports for models
-from django.db import models
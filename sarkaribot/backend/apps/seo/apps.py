@@ -14,4 +14,4 @@ class SeoConfig(AppConfig):
     
     def ready(self):
         """Initialize app when Django starts."""
-        pass
+        import apps.seo.signals
@@ -5,10 +5,11 @@ Implements NLP-powered metadata generation using spaCy for keyword extraction
 and content analysis according to Knowledge.md specifications.
 """
 
+import functools
 import logging
 import re
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Iterator
 from django.conf import settings
 from django.utils.text import slugify
 from django.utils.html import strip_tags
@@ -37,6 +38,46 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Tokenizer for the regex keyword path: words of three or more characters
+# in any script, keeping hyphenated forms like "group-c" intact. \w does
+# not cover Devanagari vowel signs, so that block is allowed explicitly
+# to keep Hindi words such as "भर्ती" whole.
+_TOKEN_RE = re.compile(r"\w[\w\u0900-\u097F\-]{2,}")
+_STOPWORDS = frozenset(STOP_WORDS)
+
+# Government-specific terms surfaced as keywords whenever they occur in the text
+_GOVT_KEYWORDS = (
+    'government', 'sarkari', 'recruitment', 'exam', 'notification',
+    'apply', 'eligibility', 'vacancy', 'job', 'post',
+)
+
+# Terms that promote a keyword in _filter_keywords, in priority order
+_GOVT_PRIORITY_TERMS = ('government', 'sarkari', 'recruitment', 'notification', 'exam')
+_GOVT_PRIORITY_RANK = {term: rank for rank, term in enumerate(_GOVT_PRIORITY_TERMS)}
+
+
+@functools.lru_cache(maxsize=10000)
+def _slug_cached(title: str) -> str:
+    """Slugify a title, memoized since titles repeat across re-scrapes."""
+    return slugify(title)
+
+
+# Pipeline components keyword extraction does not need; only the tagger runs,
+# so single words are selected by fine-grained tag_ rather than pos_/lemma_
+_SPACY_DISABLED_COMPONENTS = ('parser', 'ner', 'lemmatizer', 'attribute_ruler')
+
+# Penn Treebank tag prefixes for nouns and adjectives
+_KEYWORD_TAG_PREFIXES = ('NN', 'JJ')
+
+# Named entity labels kept as keywords
+_KEYWORD_ENTITY_LABELS = frozenset({'ORG', 'GPE', 'PERSON'})
+
+
+@functools.lru_cache(maxsize=1)
+def _get_nlp():
+    """Load the spaCy English model once per process."""
+    return spacy.load("en_core_web_sm", disable=list(_SPACY_DISABLED_COMPONENTS))
+
 
 class NLPSEOEngine:
     """
@@ -57,14 +98,24 @@ class NLPSEOEngine:
         self.seo_keywords_max_count = getattr(settings, 'SEO_KEYWORDS_MAX_COUNT', 7)
 
     def _load_nlp_model(self) -> None:
-        """Load spaCy English model with fallback."""
+        """
+        Load spaCy English model with fallback.
+
+        The spaCy pipeline is opt-in via the ``SEO_USE_SPACY`` setting; by
+        default keywords are extracted with precompiled regex tokenization,
+        which is much cheaper for short job titles and descriptions.
+        """
+        if not getattr(settings, 'SEO_USE_SPACY', False):
+            self.nlp = None
+            return
+
         if not SPACY_AVAILABLE:
             logger.warning("spaCy not available - using basic text processing")
             self.nlp = None
             return
 
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = _get_nlp()
             logger.info("Successfully loaded spaCy English model")
         except OSError:
             logger.warning(
@@ -74,12 +125,13 @@ class NLPSEOEngine:
             )
             self.nlp = None
 
-    def generate_seo_metadata(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_seo_metadata(self, job_data: Dict[str, Any], doc=None) -> Dict[str, Any]:
         """
         Generate SEO-optimized metadata using NLP as per Knowledge.md specifications.
 
         Args:
             job_data: Dictionary containing job information
+            doc: Optional spaCy document already parsed for this job
 
         Returns:
             Dictionary with SEO metadata including title, description, keywords
@@ -94,7 +146,7 @@ class NLPSEOEngine:
             logger.info(f"Generating SEO metadata for job: {job_data['title']}")
 
             # Extract keywords using spaCy NLP
-            keywords = self._extract_keywords(job_data)
+            keywords = self._extract_keywords(job_data, doc)
 
             # Generate SEO title (50-60 characters as per Knowledge.md)
             seo_title = self._generate_seo_title(job_data)
@@ -133,35 +185,72 @@ class NLPSEOEngine:
             logger.error(f"Error generating SEO metadata: {e}")
             return self._generate_fallback_metadata(job_data)
 
-    def _extract_keywords(self, job_data: Dict[str, Any]) -> List[str]:
+    def generate_seo_metadata_bulk(
+        self,
+        jobs: Iterable[Dict[str, Any]],
+        batch_size: int = 64,
+        n_process: int = 1
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Generate SEO metadata for many jobs, batching the spaCy parse.
+
+        Texts are streamed through ``nlp.pipe`` instead of parsing one
+        document per call. ``n_process`` defaults to 1 because Celery
+        prefork workers are daemonic and cannot spawn child processes.
+
+        Args:
+            jobs: Iterable of job data dictionaries
+            batch_size: Number of texts spaCy buffers per batch
+            n_process: Number of processes spaCy uses for parsing
+
+        Yields:
+            SEO metadata dictionaries in the same order as ``jobs``
+        """
+        if not self.nlp:
+            for job_data in jobs:
+                yield self.generate_seo_metadata(job_data)
+            return
+
+        jobs = list(jobs)
+        texts = (self._keyword_text(job_data) for job_data in jobs)
+        docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        for job_data, doc in zip(jobs, docs):
+            yield self.generate_seo_metadata(job_data, doc)
+
+    def _keyword_text(self, job_data: Dict[str, Any]) -> str:
+        """Combine title and description for spaCy analysis."""
+        return f"{job_data.get('title') or ''} {job_data.get('description') or ''}"
+
+    def _extract_keywords(self, job_data: Dict[str, Any], doc=None) -> List[str]:
         """Extract keywords using spaCy NLP pipeline or fallback method."""
         if not self.nlp:
             return self._extract_keywords_fallback(job_data)
 
         try:
-            # Combine title and description for analysis
-            text = job_data.get('title', '') + " " + job_data.get('description', '')
-            doc = self.nlp(text)
+            if doc is None:
+                doc = self.nlp(self._keyword_text(job_data))
 
             keywords = set()
 
             # Extract named entities (organizations, locations, etc.)
-            for ent in doc.ents:
-                if ent.label_ in ['ORG', 'GPE', 'PERSON']:
-                    keywords.add(ent.text.lower())
+            if doc.has_annotation("ENT_IOB"):
+                for ent in doc.ents:
+                    if ent.label_ in _KEYWORD_ENTITY_LABELS:
+                        keywords.add(ent.text.lower())
 
-            # Extract noun phrases
-            for chunk in doc.noun_chunks:
-                if len(chunk.text.split()) <= 3:  # Limit to 3-word phrases
-                    keywords.add(chunk.text.lower())
+            # Extract noun phrases (requires the dependency parser)
+            if doc.has_annotation("DEP"):
+                for chunk in doc.noun_chunks:
+                    if len(chunk.text.split()) <= 3:  # Limit to 3-word phrases
+                        keywords.add(chunk.text.lower())
 
             # Extract important single words
             for token in doc:
-                if (token.pos_ in ['NOUN', 'ADJ'] and 
-                    not token.is_stop and 
-                    not token.is_punct and 
+                if (token.tag_.startswith(_KEYWORD_TAG_PREFIXES) and
+                    not token.is_stop and
+                    not token.is_punct and
                     len(token.text) > 2):
-                    keywords.add(token.lemma_.lower())
+                    keywords.add(token.lower_)
 
             # Filter out common words and sort by importance
             filtered_keywords = self._filter_keywords(list(keywords), job_data)
@@ -173,46 +262,46 @@ class NLPSEOEngine:
             return self._extract_keywords_fallback(job_data)
 
     def _extract_keywords_fallback(self, job_data: Dict[str, Any]) -> List[str]:
-        """Fallback keyword extraction without spaCy."""
-        text = (job_data.get('title', '') + " " + 
-                job_data.get('description', '') + " " +
-                job_data.get('department', '')).lower()
+        """Keyword extraction using precompiled regex tokenization."""
+        text = " ".join(
+            job_data.get(field) or '' for field in ('title', 'description', 'department')
+        )
+        tokens = [token.lower() for token in _TOKEN_RE.findall(text)]
 
-        # Remove punctuation and split into words
-        text = re.sub(r'[^\w\s]', '', text)
-        words = [word for word in text.split() if word not in STOP_WORDS and len(word) > 3]
+        word_counts = Counter(word for word in tokens if word not in _STOPWORDS)
+        keywords = [word for word, _ in word_counts.most_common(self.seo_keywords_max_count)]
 
-        # Get most common words
-        word_counts = Counter(words)
-        
-        # Add government-specific keywords
-        govt_keywords = ['government', 'sarkari', 'recruitment', 'exam', 'notification', 
-                        'apply', 'eligibility', 'vacancy', 'job', 'post']
-        
-        keywords = []
-        for word, count in word_counts.most_common(10):
-            if word not in keywords:
-                keywords.append(word)
-        
         # Ensure government keywords are included
-        for govt_word in govt_keywords:
-            if govt_word in text and govt_word not in keywords:
+        token_set = set(tokens)
+        for govt_word in _GOVT_KEYWORDS:
+            if govt_word in token_set and govt_word not in keywords:
                 keywords.append(govt_word)
-        
+
         return keywords[:self.seo_keywords_max_count]
 
     def _filter_keywords(self, keywords: List[str], job_data: Dict[str, Any]) -> List[str]:
         """Filter and rank keywords by relevance."""
         # Remove very common words
-        filtered = [k for k in keywords if k not in STOP_WORDS and len(k) > 2]
-        
-        # Sort by relevance (prioritize job-specific terms)
-        govt_terms = ['government', 'sarkari', 'recruitment', 'notification', 'exam']
-        job_specific = [k for k in filtered if any(term in k for term in govt_terms)]
-        others = [k for k in filtered if k not in job_specific]
-        
+        filtered = {k for k in keywords if k not in _STOPWORDS and len(k) > 2}
+
+        # Sort by relevance (prioritize job-specific terms), then alphabetically
+        # so the result is stable across processes
+        ranked = sorted((self._keyword_priority(k), k) for k in filtered)
+        job_specific = [k for rank, k in ranked if rank < len(_GOVT_PRIORITY_TERMS)]
+        others = [k for rank, k in ranked if rank == len(_GOVT_PRIORITY_TERMS)]
+
         return job_specific + others[:self.seo_keywords_max_count]
 
+    def _keyword_priority(self, keyword: str) -> int:
+        """Rank of the first government term contained in the keyword."""
+        rank = _GOVT_PRIORITY_RANK.get(keyword)
+        if rank is not None:
+            return rank
+        for rank, term in enumerate(_GOVT_PRIORITY_TERMS):
+            if term in keyword:
+                return rank
+        return len(_GOVT_PRIORITY_TERMS)
+
     def _generate_seo_title(self, job_data: Dict[str, Any]) -> str:
         """Generate SEO-optimized title."""
         title = job_data.get('title', 'Government Job')
@@ -273,7 +362,7 @@ class NLPSEOEngine:
 
     def _generate_slug(self, title: str) -> str:
         """Generate URL-friendly slug."""
-        return slugify(title)
+        return _slug_cached(title)
 
     def _calculate_quality_score(self, job_data: Dict[str, Any], keywords: List[str]) -> float:
         """Calculate metadata quality score."""
@@ -297,14 +386,15 @@ class NLPSEOEngine:
         """Generate basic metadata when NLP processing fails."""
         title = job_data.get('title', 'Government Job')
         year = datetime.now().year
+        slug = self._generate_slug(title)
 
         return {
             'seo_title': f"{title} {year} - Apply Online",
             'seo_description': f"Apply for {title}. Check eligibility, notification details and apply online for this government job opportunity.",
             'keywords': ['government job', 'sarkari naukri', 'recruitment', f'{year} jobs'],
             'structured_data': self._generate_job_schema(job_data),
-            'slug': self._generate_slug(title),
-            'canonical_url': f"/jobs/{self._generate_slug(title)}/",
+            'slug': slug,
+            'canonical_url': f"/jobs/{slug}/",
             'generation_method': 'fallback',
             'quality_score': 50.0
         }
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.14 on 2026-10-17 12:00
+
+from django.db import migrations
+
+
+def create_title_trigram_index(apps, schema_editor):
+    """Add a pg_trgm GIN index for substring search on SEO titles."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS seo_md_title_trgm '
+        'ON seo_seometadata USING gin (title gin_trgm_ops)'
+    )
+
+
+def drop_title_trigram_index(apps, schema_editor):
+    """Remove the trigram index; the pg_trgm extension is left installed."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute('DROP INDEX IF EXISTS seo_md_title_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo', '0003_alter_keywordtracking_options_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_title_trigram_index, drop_title_trigram_index),
+    ]
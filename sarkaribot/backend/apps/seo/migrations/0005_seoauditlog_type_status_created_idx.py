@@ -0,0 +1,17 @@
+# Generated by Django 4.2.14 on 2026-10-17 02:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo', '0004_seometadata_title_trgm'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='seoauditlog',
+            index=models.Index(fields=['audit_type', 'status', '-created_at'], name='seo_auditlog_at_st_created_idx'),
+        ),
+    ]
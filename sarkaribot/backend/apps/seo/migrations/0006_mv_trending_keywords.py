@@ -0,0 +1,43 @@
+# Generated by Django 4.2.14 on 2026-10-17 12:00
+
+from django.db import migrations
+
+
+def create_trending_keywords_view(apps, schema_editor):
+    """Add the materialized view backing KeywordTrackingViewSet.trending."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(
+        'CREATE MATERIALIZED VIEW IF NOT EXISTS mv_trending_keywords AS '
+        'SELECT keyword, COUNT(*) AS total_frequency '
+        'FROM seo_keywordtracking GROUP BY keyword'
+    )
+    # A unique index is required for REFRESH ... CONCURRENTLY
+    schema_editor.execute(
+        'CREATE UNIQUE INDEX IF NOT EXISTS mv_trending_keywords_keyword '
+        'ON mv_trending_keywords (keyword)'
+    )
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS mv_trending_keywords_total '
+        'ON mv_trending_keywords (total_frequency DESC)'
+    )
+
+
+def drop_trending_keywords_view(apps, schema_editor):
+    """Remove the trending keywords materialized view."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute('DROP MATERIALIZED VIEW IF EXISTS mv_trending_keywords')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo', '0005_seoauditlog_type_status_created_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trending_keywords_view, drop_trending_keywords_view),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.14 on 2026-10-17 02:05
+
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+from django.db.models.functions import Length
+
+
+def backfill_derived_columns(apps, schema_editor):
+    """Compute the denormalized columns for existing rows in one UPDATE."""
+    SEOMetadata = apps.get_model('seo', 'SEOMetadata')
+    SEOMetadata.objects.update(
+        title_length=Length('title'),
+        description_length=Length('description'),
+        has_structured_data=Case(
+            When(structured_data={}, then=Value(False)),
+            default=Value(True)
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo', '0006_mv_trending_keywords'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='seometadata',
+            name='description_length',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='seometadata',
+            name='has_structured_data',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='seometadata',
+            name='title_length',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_derived_columns, migrations.RunPython.noop),
+    ]
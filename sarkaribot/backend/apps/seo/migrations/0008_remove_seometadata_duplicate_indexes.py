@@ -0,0 +1,21 @@
+# Generated by Django 4.2.14 on 2026-10-17 02:06
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo', '0007_seometadata_derived_columns'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='seometadata',
+            name='seo_seometa_content_fdc0b8_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='seometadata',
+            name='seo_seometa_url_pat_055fd6_idx',
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.14 on 2026-10-17 02:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo', '0008_remove_seometadata_duplicate_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='sitemapentry',
+            name='seo_sitemap_url_76a4c3_idx',
+        ),
+        migrations.AddIndex(
+            model_name='sitemapentry',
+            index=models.Index(fields=['-updated_at'], name='seo_sitemap_updated_637e44_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.14 on 2026-10-17 02:07
+
+from django.db import migrations, models
+from django.db.models import Value
+from django.db.models.functions import Length, Replace
+
+
+def backfill_keyword_count(apps, schema_editor):
+    """Count comma-separated keywords for existing rows in one UPDATE."""
+    SEOMetadata = apps.get_model('seo', 'SEOMetadata')
+    SEOMetadata.objects.exclude(keywords='').update(
+        keyword_count=Length('keywords') - Length(Replace('keywords', Value(','), Value(''))) + 1
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo', '0009_sitemapentry_updated_at_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='seometadata',
+            name='keyword_count',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_keyword_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.14 on 2026-10-17 12:00
+
+import apps.core.fields
+from django.db import migrations
+
+
+def copy_details(apps, schema_editor):
+    """Re-write existing audit details into the compressed column."""
+    SEOAuditLog = apps.get_model('seo', 'SEOAuditLog')
+    batch = []
+    for log in SEOAuditLog.objects.only('id', 'details').iterator(chunk_size=1000):
+        log.compressed_details = log.details
+        batch.append(log)
+        if len(batch) >= 1000:
+            SEOAuditLog.objects.bulk_update(batch, ['compressed_details'])
+            batch = []
+    if batch:
+        SEOAuditLog.objects.bulk_update(batch, ['compressed_details'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo', '0010_seometadata_keyword_count'),
+    ]
+
+    operations = [
+        # jsonb cannot be cast to bytea, so the data moves through a new column
+        migrations.AddField(
+            model_name='seoauditlog',
+            name='compressed_details',
+            field=apps.core.fields.CompressedJSONField(default=dict, help_text='Detailed audit results'),
+        ),
+        migrations.RunPython(copy_details, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='seoauditlog',
+            name='details',
+        ),
+        migrations.RenameField(
+            model_name='seoauditlog',
+            old_name='compressed_details',
+            new_name='details',
+        ),
+    ]
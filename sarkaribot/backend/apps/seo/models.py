@@ -8,6 +8,7 @@ and structured data handling for government job postings.
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.contrib.auth.models import User
+from apps.core.fields import CompressedJSONField
 from apps.core.models import TimestampedModel
 import uuid
 
@@ -54,7 +55,7 @@ class SitemapEntry(TimestampedModel):
             models.Index(fields=['is_active', '-priority']),
             models.Index(fields=['change_frequency']),
             models.Index(fields=['-last_modified']),
-            models.Index(fields=['url']),
+            models.Index(fields=['-updated_at']),
         ]
 
     def __str__(self) -> str:
@@ -65,6 +66,10 @@ class SEOMetadata(TimestampedModel):
     """
     Stores SEO metadata for various content types.
     """
+
+    # Columns computed in save() from the SEO fields
+    DERIVED_FIELDS = ('title_length', 'description_length', 'keyword_count', 'has_structured_data')
+
     content_type = models.CharField(
         max_length=50,
         choices=[
@@ -110,6 +115,13 @@ class SEOMetadata(TimestampedModel):
         help_text="JSON-LD structured data"
     )
 
+    # Denormalized from the fields above on save, so analysis can read
+    # small integers and a flag instead of the text and JSON columns
+    title_length = models.PositiveSmallIntegerField(default=0, editable=False)
+    description_length = models.PositiveSmallIntegerField(default=0, editable=False)
+    keyword_count = models.PositiveSmallIntegerField(default=0, editable=False)
+    has_structured_data = models.BooleanField(default=False, editable=False)
+
     # OpenGraph Data
     og_title = models.CharField(max_length=95, blank=True)
     og_description = models.CharField(max_length=300, blank=True)
@@ -153,16 +165,28 @@ class SEOMetadata(TimestampedModel):
     class Meta:
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['content_type', 'content_id']),
-            models.Index(fields=['url_path']),
             models.Index(fields=['title']),
             models.Index(fields=['-updated_at']),
         ]
+        # Also serves as the (content_type, content_id) lookup index
         unique_together = ['content_type', 'content_id']
 
     def __str__(self) -> str:
         return f"SEO: {self.title} ({self.content_type})"
 
+    def save(self, *args, **kwargs):
+        """Refresh the denormalized length, keyword count and structured data columns."""
+        self.title_length = len(self.title)
+        self.description_length = len(self.description)
+        self.keyword_count = self.keywords.count(',') + 1 if self.keywords else 0
+        self.has_structured_data = bool(self.structured_data)
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, *self.DERIVED_FIELDS}
+
+        super().save(*args, **kwargs)
+
 
 class KeywordTracking(TimestampedModel):
     """
@@ -258,7 +282,7 @@ class SEOAuditLog(TimestampedModel):
         ],
         default='success'
     )
-    details = models.JSONField(
+    details = CompressedJSONField(
         default=dict,
         help_text="Detailed audit results"
     )
@@ -290,6 +314,7 @@ class SEOAuditLog(TimestampedModel):
         indexes = [
             models.Index(fields=['audit_type', '-created_at']),
             models.Index(fields=['status', '-created_at']),
+            models.Index(fields=['audit_type', 'status', '-created_at'], name='seo_auditlog_at_st_created_idx'),
             models.Index(fields=['content_type', 'content_id']),
         ]
 
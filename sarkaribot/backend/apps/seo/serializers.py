@@ -6,9 +6,30 @@ according to Knowledge.md specifications.
 """
 
 from rest_framework import serializers
+from apps.core.caching import invalidate_list_cache
 from .models import SEOMetadata, KeywordTracking, SitemapEntry, SEOAuditLog
 
 
+class SEOMetadataListSerializer(serializers.ModelSerializer):
+    """
+    Lightweight serializer for SEO metadata lists.
+    
+    Covers only the columns loaded by SEOMetadataViewSet for list pages.
+    """
+    
+    class Meta:
+        model = SEOMetadata
+        fields = [
+            'id',
+            'content_type',
+            'content_id',
+            'url_path',
+            'title',
+            'description',
+            'updated_at'
+        ]
+
+
 class SEOMetadataSerializer(serializers.ModelSerializer):
     """
     Serializer for SEO metadata model.
@@ -17,21 +38,17 @@ class SEOMetadataSerializer(serializers.ModelSerializer):
     keywords, and structured data.
     """
     
-    content_type_name = serializers.CharField(source='content_type.model', read_only=True)
-    
     class Meta:
         model = SEOMetadata
         fields = [
             'id',
             'content_type',
-            'content_type_name',
-            'object_id',
-            'page_type',
-            'seo_title',
-            'seo_description',
+            'content_id',
+            'url_path',
+            'title',
+            'description',
             'keywords',
             'canonical_url',
-            'meta_robots',
             'og_title',
             'og_description',
             'og_image',
@@ -41,12 +58,14 @@ class SEOMetadataSerializer(serializers.ModelSerializer):
             'twitter_image',
             'twitter_card',
             'structured_data',
+            'generation_method',
+            'quality_score',
             'created_at',
             'updated_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at', 'content_type_name']
+        read_only_fields = ['id', 'created_at', 'updated_at']
     
-    def validate_seo_title(self, value):
+    def validate_title(self, value):
         """Validate SEO title length."""
         if len(value) > 60:
             raise serializers.ValidationError("SEO title must be 60 characters or less.")
@@ -54,7 +73,7 @@ class SEOMetadataSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("SEO title should be at least 30 characters.")
         return value
     
-    def validate_seo_description(self, value):
+    def validate_description(self, value):
         """Validate SEO description length."""
         if len(value) > 160:
             raise serializers.ValidationError("SEO description must be 160 characters or less.")
@@ -63,6 +82,24 @@ class SEOMetadataSerializer(serializers.ModelSerializer):
         return value
 
 
+class KeywordTrackingListSerializer(serializers.ListSerializer):
+    """
+    List serializer that creates keyword tracking rows in bulk.
+
+    A list payload is written with batched multi-row INSERTs instead of
+    one INSERT per keyword.
+    """
+    
+    def create(self, validated_data):
+        keywords = KeywordTracking.objects.bulk_create(
+            [KeywordTracking(**attrs) for attrs in validated_data],
+            batch_size=500
+        )
+        # bulk_create does not send post_save, so drop cached lists here
+        invalidate_list_cache(KeywordTracking)
+        return keywords
+
+
 class KeywordTrackingSerializer(serializers.ModelSerializer):
     """
     Serializer for keyword tracking model.
@@ -70,22 +107,24 @@ class KeywordTrackingSerializer(serializers.ModelSerializer):
     Tracks keyword usage and performance metrics.
     """
     
-    job_title = serializers.CharField(source='job_posting.title', read_only=True)
-    
     class Meta:
         model = KeywordTracking
+        list_serializer_class = KeywordTrackingListSerializer
         fields = [
             'id',
             'keyword',
-            'job_posting',
-            'job_title',
-            'frequency',
-            'position',
-            'context',
+            'target_url',
+            'current_position',
+            'previous_position',
+            'best_position',
+            'search_volume',
+            'difficulty_score',
+            'is_target_keyword',
+            'last_checked',
             'created_at',
             'updated_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at', 'job_title']
+        read_only_fields = ['id', 'created_at', 'updated_at']
     
     def validate_keyword(self, value):
         """Validate keyword format."""
@@ -108,7 +147,7 @@ class SitemapEntrySerializer(serializers.ModelSerializer):
         fields = [
             'id',
             'url',
-            'url_type',
+            'is_active',
             'priority',
             'change_frequency',
             'last_modified',
@@ -137,11 +176,13 @@ class SEOAuditLogSerializer(serializers.ModelSerializer):
     Tracks SEO operations and their outcomes for auditing.
     """
     
+    details = serializers.JSONField(read_only=True)
+    
     class Meta:
         model = SEOAuditLog
         fields = [
             'id',
-            'action_type',
+            'audit_type',
             'details',
             'status',
             'created_at'
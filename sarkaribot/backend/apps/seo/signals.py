@@ -0,0 +1,25 @@
+"""
+Django signals for the SEO app.
+"""
+
+from django.db.models.signals import post_save, post_delete
+
+from apps.core.utils import safe_signal
+from apps.core.caching import invalidate_list_cache
+from .models import SEOMetadata, KeywordTracking, SitemapEntry, SEOAuditLog
+
+# Models whose API list responses are cached
+CACHED_LIST_MODELS = (SEOMetadata, KeywordTracking, SitemapEntry, SEOAuditLog)
+
+
+@safe_signal('invalidate_seo_list_cache')
+def invalidate_seo_list_cache(sender, **kwargs):
+    """
+    Drop cached list responses when an SEO row is written or deleted.
+    """
+    invalidate_list_cache(sender)
+
+
+for _model in CACHED_LIST_MODELS:
+    post_save.connect(invalidate_seo_list_cache, sender=_model)
+    post_delete.connect(invalidate_seo_list_cache, sender=_model)
@@ -5,16 +5,56 @@ This module contains background tasks for generating and updating
 SEO metadata for job postings using NLP and automation.
 """
 
-from celery import shared_task
+from celery import group, shared_task
+from django.core.cache import cache
+from django.db import connection
 from django.utils import timezone
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, BinaryIO, Iterable, Iterator
+import gzip
+import hashlib
+import io
+import json
 import logging
 from datetime import timedelta
+from lxml import etree
+
+# The shared engine loads its NLP model at import, so worker processes pay
+# that cost once at startup rather than on every task
+from apps.seo.engine import seo_engine
 
 logger = logging.getLogger(__name__)
 
+# Job statuses that are publicly listed and therefore eligible for SEO work
+_SITEMAP_ACTIVE_STATUSES = frozenset({'announced', 'admit_card', 'answer_key', 'result'})
+
+# Forced regenerations of one category run at most once per window; changes
+# arriving inside the window are coalesced into one trailing run. The
+# trailing run's countdown must stay well below the Redis broker's
+# visibility timeout (1 hour by default), or the acks_late ETA message is
+# redelivered and the regeneration runs more than once.
+_CATEGORY_REGEN_WINDOW_SECONDS = 60 * 15
+
+# JobPosting columns written by SEO metadata generation
+_SEO_UPDATE_FIELDS = ['seo_title', 'seo_description', 'keywords', 'structured_data', 'seo_quality']
+
+# Rows fetched and written per round-trip by the bulk generation task
+_SEO_BULK_BATCH_SIZE = 500
+
+# Jobs handled by each batch task when fanning out SEO generation
+_SEO_DISPATCH_CHUNK_SIZE = 100
+
+# Namespace declared on the sitemap <urlset> root element
+_SITEMAP_NAMESPACE = 'http://www.sitemaps.org/schemas/sitemap/0.9'
 
-@shared_task(bind=True, max_retries=2)
+# How long generated metadata is reused for unchanged job content
+_SEO_METADATA_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+
+# Engine input fields that influence generated metadata; only these are hashed
+# so changes to unrelated columns do not invalidate cached output
+_SEO_ENGINE_INPUT_FIELDS = ('title', 'description', 'department', 'total_posts', 'application_end_date')
+
+
+@shared_task(bind=True, max_retries=2, ignore_result=True)
 def generate_seo_metadata(self, job_posting_id: int, force_update: bool = False):
     """
     Generate SEO metadata for a single job posting.
@@ -27,65 +67,51 @@ def generate_seo_metadata(self, job_posting_id: int, force_update: bool = False)
         Dict with generation results
     """
     from apps.jobs.models import JobPosting
-    from apps.seo.engine import NLPSEOEngine
 
     try:
-        # Get the job posting
-        job_posting = JobPosting.objects.get(id=job_posting_id)
+        # Check if metadata already exists and force_update is False. Only the
+        # SEO columns are read so the common skip path never hydrates a model.
+        if not force_update:
+            existing = JobPosting.objects.filter(id=job_posting_id).values(
+                'seo_title', 'seo_description', 'keywords'
+            ).first()
+            if existing is None:
+                raise JobPosting.DoesNotExist
+            if all(existing.values()):
+                logger.info(f"SEO metadata already exists for job {job_posting_id}, skipping")
+                return {
+                    'success': True,
+                    'job_id': job_posting_id,
+                    'action': 'skipped',
+                    'reason': 'metadata_exists'
+                }
 
-        # Check if metadata already exists and force_update is False
-        if (job_posting.seo_title and job_posting.seo_description and
-            job_posting.keywords and not force_update):
-            logger.info(f"SEO metadata already exists for job {job_posting_id}, skipping")
-            return {
-                'success': True,
-                'job_id': job_posting_id,
-                'action': 'skipped',
-                'reason': 'metadata_exists'
-            }
-
-        # Initialize SEO engine
-        seo_engine = NLPSEOEngine()
+        # Get the job posting
+        job_posting = JobPosting.objects.select_related('category', 'source').get(id=job_posting_id)
 
         # Prepare job data for SEO generation
-        job_data = {
-            'title': job_posting.title,
-            'description': job_posting.description,
-            'department': job_posting.department,
-            'total_posts': job_posting.total_posts,
-            'qualification': job_posting.qualification,
-            'notification_date': job_posting.notification_date,
-            'application_end_date': job_posting.application_end_date,
-            'exam_date': job_posting.exam_date,
-            'salary_min': job_posting.salary_min,
-            'salary_max': job_posting.salary_max,
-            'min_age': job_posting.min_age,
-            'max_age': job_posting.max_age,
-            'source_url': job_posting.source_url,
-            'application_link': job_posting.application_link,
-            'slug': job_posting.slug,
-            'category': {
-                'name': job_posting.category.name if job_posting.category else None,
-                'slug': job_posting.category.slug if job_posting.category else None,
-            },
-            'source': {
-                'base_url': job_posting.source.base_url if job_posting.source else '',
-            }
-        }
+        job_data = _prepare_job_data_for_seo(job_posting)
 
         # Generate SEO metadata
         logger.info(f"Generating SEO metadata for job: {job_posting.title}")
-        seo_metadata = seo_engine.generate_seo_metadata(job_data)
+        seo_metadata = generate_seo_metadata_cached(job_data)
 
-        # Update job posting with SEO metadata
-        job_posting.seo_title = seo_metadata.get('seo_title', '')
-        job_posting.seo_description = seo_metadata.get('seo_description', '')
-        job_posting.keywords = ', '.join(seo_metadata.get('keywords', []))
-        job_posting.structured_data = seo_metadata.get('structured_data', {})
+        # Update job posting with SEO metadata, skipping the write entirely
+        # when regeneration reproduced what is already stored
+        changed_fields = _apply_seo_metadata(job_posting, seo_metadata)
+        if not changed_fields:
+            logger.info(f"SEO metadata unchanged for job {job_posting_id}, skipping write")
+            return {
+                'success': True,
+                'job_id': job_posting_id,
+                'action': 'unchanged'
+            }
 
-        job_posting.save(update_fields=[
-            'seo_title', 'seo_description', 'keywords', 'structured_data',
-        ])
+        # No save() signal handlers depend on SEO fields, so write them with
+        # a plain UPDATE rather than going through Model.save()
+        JobPosting.objects.filter(pk=job_posting_id).update(
+            **{field: getattr(job_posting, field) for field in changed_fields}
+        )
 
         logger.info(f"SEO metadata generated successfully for job {job_posting_id}")
 
@@ -120,9 +146,264 @@ def generate_seo_metadata(self, job_posting_id: int, force_update: bool = False)
             }
 
 
+@shared_task(ignore_result=True)
+def generate_seo_metadata_bulk(job_posting_ids: List[int], force_update: bool = False):
+    """
+    Generate SEO metadata for a batch of job postings.
+
+    Loads the postings with a single streamed SELECT and writes the results
+    back with bulk_update, so a large import costs a handful of round-trips
+    instead of a SELECT and UPDATE per job.
+
+    Args:
+        job_posting_ids: IDs of the job postings
+        force_update: Whether to force update existing metadata
+
+    Returns:
+        Dict with batch generation results
+    """
+    from apps.jobs.models import JobPosting
+
+    updated_jobs = []
+    changed_fields = set()
+    skipped = 0
+    unchanged = 0
+    failed = 0
+
+    queryset = JobPosting.objects.select_related('category', 'source').filter(
+        pk__in=job_posting_ids
+    )
+
+    pending = []
+    for job_posting in queryset.iterator(chunk_size=_SEO_BULK_BATCH_SIZE):
+        if (job_posting.seo_title and job_posting.seo_description and
+            job_posting.keywords and not force_update):
+            skipped += 1
+            continue
+
+        job_data = _prepare_job_data_for_seo(job_posting)
+        pending.append((job_posting, job_data, _seo_metadata_cache_key(job_data)))
+
+    # Cache misses go through the engine in one batched NLP pass
+    cached = cache.get_many([cache_key for _, _, cache_key in pending])
+    misses = [entry for entry in pending if entry[2] not in cached]
+    generated = {}
+    try:
+        for (job_posting, _, cache_key), seo_metadata in zip(
+            misses,
+            seo_engine.generate_seo_metadata_bulk([job_data for _, job_data, _ in misses])
+        ):
+            generated[job_posting.pk] = seo_metadata
+            if seo_metadata.get('generation_method') != 'fallback':
+                cache.set(cache_key, seo_metadata, _SEO_METADATA_CACHE_TIMEOUT)
+    except Exception as e:
+        logger.error(f"Batched SEO metadata generation failed: {e}")
+
+    for job_posting, _, cache_key in pending:
+        seo_metadata = cached[cache_key] if cache_key in cached else generated.get(job_posting.pk)
+        if seo_metadata is None:
+            failed += 1
+            continue
+
+        changed = _apply_seo_metadata(job_posting, seo_metadata)
+        if not changed:
+            unchanged += 1
+            continue
+
+        changed_fields.update(changed)
+        updated_jobs.append(job_posting)
+
+    # Only columns that changed on at least one job are rewritten
+    if updated_jobs:
+        JobPosting.objects.bulk_update(
+            updated_jobs,
+            [field for field in _SEO_UPDATE_FIELDS if field in changed_fields],
+            batch_size=_SEO_BULK_BATCH_SIZE
+        )
+
+    logger.info(f"Bulk SEO metadata generated: {len(updated_jobs)} updated, "
+               f"{unchanged} unchanged, {skipped} skipped, {failed} failed")
+
+    return {
+        'success': True,
+        'total_jobs': len(job_posting_ids),
+        'updated': len(updated_jobs),
+        'unchanged': unchanged,
+        'skipped': skipped,
+        'failed': failed,
+    }
+
+
+def _dispatch_seo_batches(job_ids: List[int], force_update: bool = False) -> None:
+    """
+    Queue generate_seo_metadata_bulk over job IDs in fixed-size batches.
+
+    Args:
+        job_ids: IDs of the job postings to process
+        force_update: Whether to force update existing metadata
+    """
+    group(
+        generate_seo_metadata_bulk.s(job_ids[i:i + _SEO_DISPATCH_CHUNK_SIZE], force_update)
+        for i in range(0, len(job_ids), _SEO_DISPATCH_CHUNK_SIZE)
+    ).apply_async()
+
+
+def _seo_metadata_cache_key(job_data: Dict[str, Any]) -> str:
+    """
+    Build the cache key for the engine output on the given job data.
+
+    The key is a BLAKE2b hash of the fields the engine reads plus the
+    current year, which the engine stamps into titles.
+
+    Args:
+        job_data: Engine input, e.g. from _prepare_job_data_for_seo
+
+    Returns:
+        Cache key string
+    """
+    content = json.dumps(
+        [timezone.now().year] + [job_data.get(field) for field in _SEO_ENGINE_INPUT_FIELDS],
+        default=str
+    )
+    content_hash = hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+    return f"seo:v3:{content_hash}"
+
+
+def generate_seo_metadata_cached(job_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run the SEO engine, reusing earlier output for identical job content.
+
+    Periodic refreshes of postings whose content is unchanged hit the
+    cache and skip the NLP pass entirely. Fallback output is never cached.
+
+    Args:
+        job_data: Engine input, e.g. from _prepare_job_data_for_seo
+
+    Returns:
+        Generated SEO metadata dictionary
+    """
+    cache_key = _seo_metadata_cache_key(job_data)
+
+    seo_metadata = cache.get(cache_key)
+    if seo_metadata is None:
+        seo_metadata = seo_engine.generate_seo_metadata(job_data)
+        if seo_metadata.get('generation_method') != 'fallback':
+            cache.set(cache_key, seo_metadata, _SEO_METADATA_CACHE_TIMEOUT)
+
+    return seo_metadata
+
+
+def _apply_seo_metadata(job_posting, seo_metadata: Dict[str, Any]) -> List[str]:
+    """
+    Copy generated SEO metadata onto a job posting without saving it.
+
+    Args:
+        job_posting: JobPosting instance
+        seo_metadata: Output of the SEO engine
+
+    Returns:
+        Names of the SEO fields whose value changed, empty if none did
+    """
+    previous = {field: getattr(job_posting, field) for field in _SEO_UPDATE_FIELDS}
+
+    job_posting.seo_title = seo_metadata.get('seo_title', '')
+    job_posting.seo_description = seo_metadata.get('seo_description', '')
+    job_posting.set_keywords(seo_metadata.get('keywords', []))
+    job_posting.structured_data = seo_metadata.get('structured_data', {})
+    job_posting.seo_quality = job_posting.calculate_seo_quality()
+
+    return [
+        field for field, value in previous.items()
+        if getattr(job_posting, field) != value
+    ]
+
+
+def _iso(value) -> Optional[str]:
+    """Return the ISO-8601 form of a date/datetime, or None when unset."""
+    return value.isoformat() if value else None
+
+
+def _prepare_job_data_for_seo(job_posting) -> Dict[str, Any]:
+    """
+    Build the SEO engine input for a job posting.
+
+    Dates are pre-serialized so the generated structured data stays JSON
+    safe, and unset fields are omitted to keep the payload small.
+
+    Args:
+        job_posting: JobPosting instance
+
+    Returns:
+        Dictionary of job data for NLPSEOEngine.generate_seo_metadata
+    """
+    fields = {
+        'title': job_posting.title,
+        'description': job_posting.description,
+        'department': job_posting.department,
+        'total_posts': job_posting.total_posts,
+        'qualification': job_posting.qualification,
+        'notification_date': _iso(job_posting.notification_date),
+        'application_end_date': _iso(job_posting.application_end_date),
+        'exam_date': _iso(job_posting.exam_date),
+        'salary_min': job_posting.salary_min,
+        'salary_max': job_posting.salary_max,
+        'min_age': job_posting.min_age,
+        'max_age': job_posting.max_age,
+        'source_url': job_posting.source_url,
+        'application_link': job_posting.application_link,
+        'slug': job_posting.slug,
+    }
+    job_data = {key: value for key, value in fields.items() if value is not None}
+
+    job_data['category'] = {
+        'name': job_posting.category.name if job_posting.category else None,
+        'slug': job_posting.category.slug if job_posting.category else None,
+    }
+    job_data['source'] = {
+        'base_url': job_posting.source.base_url if job_posting.source else '',
+    }
+    return job_data
+
+
+def _claim_category_regeneration(category_slug: str, trailing: bool) -> bool:
+    """
+    Decide whether a forced category regeneration should run now.
+
+    The first request in a window runs immediately. Later requests in the
+    same window schedule a single trailing run at the end of the window,
+    so the last change to the category is always picked up.
+
+    Args:
+        category_slug: Slug of the category being regenerated
+        trailing: Whether this is the scheduled trailing run
+
+    Returns:
+        True if the regeneration should run now
+    """
+    window_key = f'seo:catregen:{category_slug}'
+    pending_key = f'seo:catregen-pending:{category_slug}'
+
+    if trailing:
+        cache.delete(pending_key)
+        cache.set(window_key, True, _CATEGORY_REGEN_WINDOW_SECONDS)
+        return True
+
+    if cache.add(window_key, True, _CATEGORY_REGEN_WINDOW_SECONDS):
+        return True
+
+    # Pending outlives the countdown so it is only cleared by the trailing run
+    if cache.add(pending_key, True, _CATEGORY_REGEN_WINDOW_SECONDS * 2):
+        bulk_generate_seo_metadata.apply_async(
+            kwargs={'category_slug': category_slug, 'force_update': True, 'trailing': True},
+            countdown=_CATEGORY_REGEN_WINDOW_SECONDS
+        )
+    return False
+
+
 @shared_task
 def bulk_generate_seo_metadata(job_ids: Optional[List[int]] = None, category_slug: Optional[str] = None,
-                              days_back: Optional[int] = None, force_update: bool = False):
+                              days_back: Optional[int] = None, force_update: bool = False,
+                              trailing: bool = False):
     """
     Generate SEO metadata for multiple job postings.
 
@@ -131,6 +412,8 @@ def bulk_generate_seo_metadata(job_ids: Optional[List[int]] = None, category_slu
         category_slug: Process jobs from specific category
         days_back: Process jobs from last N days
         force_update: Whether to force update existing metadata
+        trailing: Set on the coalesced trailing run of a forced category
+            regeneration; not meant for callers
 
     Returns:
         Dict with bulk processing results
@@ -145,6 +428,22 @@ def bulk_generate_seo_metadata(job_ids: Optional[List[int]] = None, category_slu
             queryset = JobPosting.objects.filter(id__in=job_ids)
         elif category_slug:
             category = JobCategory.objects.get(slug=category_slug)
+
+            # A category-wide forced regeneration rewrites every job in the
+            # category, so rapid repeats (e.g. successive admin edits) are
+            # coalesced into one trailing run
+            if force_update and not _claim_category_regeneration(category_slug, trailing):
+                logger.info(f"SEO regeneration for category {category_slug} ran recently, "
+                            f"coalescing into a trailing run")
+                return {
+                    'success': True,
+                    'total_jobs': 0,
+                    'processed': 0,
+                    'skipped': 0,
+                    'failed': 0,
+                    'message': 'Category regeneration coalesced'
+                }
+
             queryset = JobPosting.objects.filter(category=category)
         elif days_back:
             cutoff_date = timezone.now() - timedelta(days=days_back)
@@ -159,9 +458,29 @@ def bulk_generate_seo_metadata(job_ids: Optional[List[int]] = None, category_slu
             )
 
         # Filter active jobs only
-        queryset = queryset.filter(status__in=['announced', 'admit_card', 'answer_key', 'result'])
+        queryset = queryset.filter(status__in=_SITEMAP_ACTIVE_STATUSES)
+
+        # Let the database drop jobs that already have complete metadata;
+        # the count is only needed to report how many were skipped
+        total_jobs = None
+        if not force_update:
+            total_jobs = queryset.count()
+            queryset = queryset.exclude(
+                seo_title__gt='', seo_description__gt='', keywords__gt=''
+            )
+
+        # Materialize the ids once and use their length instead of COUNT queries.
+        # Ordering by pk replaces the model's default published_at/created_at
+        # sort and the iterator streams them through a server-side cursor.
+        pending_ids = list(
+            queryset.order_by('pk').values_list('id', flat=True).iterator(
+                chunk_size=_SEO_BULK_BATCH_SIZE
+            )
+        )
+        if total_jobs is None:
+            total_jobs = len(pending_ids)
+        skipped = total_jobs - len(pending_ids)
 
-        total_jobs = queryset.count()
         logger.info(f"Starting bulk SEO metadata generation for {total_jobs} jobs")
 
         if total_jobs == 0:
@@ -174,33 +493,19 @@ def bulk_generate_seo_metadata(job_ids: Optional[List[int]] = None, category_slu
                 'message': 'No jobs found to process'
             }
 
-        # Process jobs in batches to avoid memory issues
-        batch_size = 50
         processed = 0
-        skipped = 0
         failed = 0
 
-        for i in range(0, total_jobs, batch_size):
-            batch = queryset[i:i + batch_size]
-
-            for job in batch:
-                try:
-                    # Check if update needed
-                    if (job.seo_title and job.seo_description and
-                        job.keywords and not force_update):
-                        skipped += 1
-                        continue
-
-                    # Generate metadata asynchronously
-                    generate_seo_metadata.delay(job.pk, force_update)
-
-                    # For bulk operations, we don't wait for individual results
-                    # The tasks will run in background
-                    processed += 1
-
-                except Exception as e:
-                    logger.error(f"Failed to queue SEO generation for job {job.pk}: {e}")
-                    failed += 1
+        # Generate metadata asynchronously in batch tasks, each of which
+        # writes its results with one bulk_update; for bulk operations we
+        # don't wait for individual results.
+        if pending_ids:
+            try:
+                _dispatch_seo_batches(pending_ids, force_update)
+                processed = len(pending_ids)
+            except Exception as e:
+                logger.error(f"Failed to queue SEO generation for {len(pending_ids)} jobs: {e}")
+                failed = len(pending_ids)
 
         logger.info(f"Bulk SEO generation queued: {processed} processed, "
                    f"{skipped} skipped, {failed} failed")
@@ -232,14 +537,14 @@ def update_outdated_seo_metadata():
         # Find jobs with outdated SEO metadata (older than 30 days)
         cutoff_date = timezone.now() - timedelta(days=30)
 
-        outdated_jobs = JobPosting.objects.filter(
+        outdated_job_ids = list(JobPosting.objects.filter(
             Q(seo_title__isnull=True) | Q(seo_description__isnull=True),
-            status__in=['announced', 'admit_card', 'answer_key', 'result']
-        ).order_by('-created_at')[:100]  # Limit to 100 jobs per run
+            status__in=_SITEMAP_ACTIVE_STATUSES
+        ).order_by('-created_at').values_list('id', flat=True)[:100])  # Limit to 100 jobs per run
 
-        logger.info(f"Found {outdated_jobs.count()} jobs with outdated SEO metadata")
+        logger.info(f"Found {len(outdated_job_ids)} jobs with outdated SEO metadata")
 
-        if not outdated_jobs.exists():
+        if not outdated_job_ids:
             return {
                 'success': True,
                 'updated': 0,
@@ -248,12 +553,11 @@ def update_outdated_seo_metadata():
 
         # Queue SEO generation for outdated jobs
         updated_count = 0
-        for job in outdated_jobs:
-            try:
-                generate_seo_metadata.delay(job.pk, force_update=True)
-                updated_count += 1
-            except Exception as e:
-                logger.error(f"Failed to queue SEO update for job {job.pk}: {e}")
+        try:
+            _dispatch_seo_batches(outdated_job_ids, force_update=True)
+            updated_count = len(outdated_job_ids)
+        except Exception as e:
+            logger.error(f"Failed to queue SEO update for {len(outdated_job_ids)} jobs: {e}")
 
         logger.info(f"Queued SEO updates for {updated_count} jobs")
 
@@ -281,38 +585,29 @@ def generate_sitemap_data():
     try:
         # Get all active job postings
         active_jobs = JobPosting.objects.filter(
-            status__in=['announced', 'admit_card', 'answer_key', 'result'],
+            status__in=_SITEMAP_ACTIVE_STATUSES,
             published_at__isnull=False
         ).order_by('-created_at')
 
-        logger.info(f"Generating sitemap for {active_jobs.count()} active jobs")
+        logger.info("Generating sitemap for active jobs")
 
-        sitemap_entries = []
+        rows = active_jobs.values_list(
+            'slug', 'updated_at', 'is_featured', 'total_posts'
+        ).iterator(chunk_size=1000)
 
-        for job in active_jobs:
-            entry = {
-                'url': f"https://sarkaribot.com/jobs/{job.slug}",
-                'lastmod': job.updated_at.strftime('%Y-%m-%d'),
-                'changefreq': 'weekly',
-                'priority': '0.8'
-            }
-            sitemap_entries.append(entry)
-
-        # Generate XML sitemap
-        sitemap_xml = generate_sitemap_xml(sitemap_entries)
-
-        # Save sitemap to file
-        sitemap_path = os.path.join(settings.STATIC_ROOT or 'static', 'sitemap.xml')
+        # Save gzipped sitemap to file, streaming rows straight into it;
+        # crawlers accept sitemap.xml.gz and it is roughly 10x smaller
+        sitemap_path = os.path.join(settings.STATIC_ROOT or 'static', 'sitemap.xml.gz')
         os.makedirs(os.path.dirname(sitemap_path), exist_ok=True)
 
-        with open(sitemap_path, 'w', encoding='utf-8') as f:
-            f.write(sitemap_xml)
+        with gzip.open(sitemap_path, 'wb', compresslevel=6) as f:
+            urls_count = write_sitemap(f, _iter_sitemap_entries(rows))
 
-        logger.info(f"Sitemap generated with {len(sitemap_entries)} URLs")
+        logger.info(f"Sitemap generated with {urls_count} URLs")
 
         return {
             'success': True,
-            'urls_count': len(sitemap_entries),
+            'urls_count': urls_count,
             'sitemap_path': sitemap_path
         }
 
@@ -321,34 +616,96 @@ def generate_sitemap_data():
         raise
 
 
-def generate_sitemap_xml(entries: List[Dict[str, str]]) -> str:
+def _iter_sitemap_entries(rows: Iterable[tuple]) -> Iterator[Dict[str, str]]:
+    """
+    Lazily build sitemap entries from job posting rows.
+
+    Args:
+        rows: (slug, updated_at, is_featured, total_posts) tuples
+
+    Yields:
+        Sitemap entry dictionaries
+    """
+    for slug, updated_at, is_featured, total_posts in rows:
+        yield {
+            'url': f"https://sarkaribot.com/jobs/{slug}",
+            'lastmod': updated_at.strftime('%Y-%m-%d'),
+            'changefreq': 'weekly',
+            'priority': '0.9' if is_featured or (total_posts or 0) > 100 else '0.8'
+        }
+
+
+def write_sitemap(fh: BinaryIO, entries: Iterable[Dict[str, str]]) -> int:
     """
-    Generate XML sitemap from entries.
+    Write an XML sitemap to a file handle one URL at a time.
+
+    Uses lxml's incremental writer so memory stays constant and all text
+    is escaped correctly.
 
     Args:
-        entries: List of sitemap entry dictionaries
+        fh: Writable binary file handle
+        entries: Iterable of sitemap entry dictionaries
 
     Returns:
-        XML sitemap as string
+        Number of URLs written
     """
-    xml_lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
-    ]
+    count = 0
+
+    with etree.xmlfile(fh, encoding='utf-8') as xf:
+        xf.write_declaration()
+        with xf.element(f'{{{_SITEMAP_NAMESPACE}}}urlset', nsmap={None: _SITEMAP_NAMESPACE}):
+            xf.write('\n')
+            for entry in entries:
+                xf.write(_sitemap_url_element(entry), pretty_print=True)
+                count += 1
+
+    return count
+
 
-    for entry in entries:
-        xml_lines.extend([
-            '  <url>',
-            f'    <loc>{entry["url"]}</loc>',
-            f'    <lastmod>{entry["lastmod"]}</lastmod>',
-            f'    <changefreq>{entry["changefreq"]}</changefreq>',
-            f'    <priority>{entry["priority"]}</priority>',
-            '  </url>'
-        ])
+def iter_sitemap_xml(entries: Iterable[Dict[str, str]], chunk_size: int = 1000) -> Iterator[bytes]:
+    """
+    Render an XML sitemap as a stream of byte chunks.
 
-    xml_lines.append('</urlset>')
+    Suitable for a StreamingHttpResponse: only one chunk of URLs is held
+    in memory at a time.
 
-    return '\n'.join(xml_lines)
+    Args:
+        entries: Iterable of sitemap entry dictionaries
+        chunk_size: Number of URLs per yielded chunk
+
+    Yields:
+        Encoded sitemap XML fragments
+    """
+    buffer = io.BytesIO()
+
+    def drain() -> bytes:
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    with etree.xmlfile(buffer, encoding='utf-8') as xf:
+        xf.write_declaration()
+        with xf.element(f'{{{_SITEMAP_NAMESPACE}}}urlset', nsmap={None: _SITEMAP_NAMESPACE}):
+            xf.write('\n')
+            for count, entry in enumerate(entries, 1):
+                xf.write(_sitemap_url_element(entry), pretty_print=True)
+                if count % chunk_size == 0:
+                    xf.flush()
+                    yield drain()
+
+    yield drain()
+
+
+def _sitemap_url_element(entry: Dict[str, str]):
+    """Build the <url> element for one sitemap entry."""
+    url = etree.Element('url')
+    etree.SubElement(url, 'loc').text = entry['url']
+    if entry.get('lastmod'):
+        etree.SubElement(url, 'lastmod').text = entry['lastmod']
+    etree.SubElement(url, 'changefreq').text = entry['changefreq']
+    etree.SubElement(url, 'priority').text = entry['priority']
+    return url
 
 
 @shared_task
@@ -359,54 +716,41 @@ def analyze_seo_performance():
     This task runs weekly to generate SEO performance reports.
     """
     from apps.jobs.models import JobPosting
-    from django.db import models
+    from django.db.models import Count, Q
+    from django.db.models.functions import Length
 
     try:
-        # Get all active jobs with SEO metadata
-        jobs_with_seo = JobPosting.objects.filter(
-            status__in=['announced', 'admit_card', 'answer_key', 'result'],
-            seo_title__isnull=False,
-            seo_description__isnull=False
-        ).exclude(
-            seo_title='',
-            seo_description=''
+        # Every metric is a filtered count over the active jobs, so compute
+        # them all in a single aggregate query instead of one COUNT each
+        has_seo = ~Q(seo_title='', seo_description='')
+
+        counts = JobPosting.objects.filter(
+            status__in=_SITEMAP_ACTIVE_STATUSES
+        ).annotate(
+            seo_title_length=Length('seo_title'),
+            seo_description_length=Length('seo_description'),
+        ).aggregate(
+            total_jobs=Count('id'),
+            jobs_with_seo=Count('id', filter=has_seo),
+            titles_optimal=Count('id', filter=has_seo & Q(seo_title_length__range=(40, 60))),
+            descriptions_optimal=Count('id', filter=has_seo & Q(seo_description_length__range=(140, 160))),
+            jobs_with_keywords=Count('id', filter=has_seo & ~Q(keywords='')),
+            jobs_with_structured_data=Count('id', filter=has_seo & Q(structured_data__isnull=False)),
         )
 
-        total_jobs = JobPosting.objects.filter(
-            status__in=['announced', 'admit_card', 'answer_key', 'result']
-        ).count()
+        total_jobs = counts['total_jobs']
 
         # Calculate metrics
-        coverage_rate = (jobs_with_seo.count() / total_jobs * 100) if total_jobs > 0 else 0
-
-        # Analyze title lengths
-        titles_optimal = jobs_with_seo.filter(
-            seo_title__regex=r'^.{40,60}$'
-        ).count()
-
-        # Analyze description lengths
-        descriptions_optimal = jobs_with_seo.filter(
-            seo_description__regex=r'^.{140,160}$'
-        ).count()
-
-        # Jobs with keywords
-        jobs_with_keywords = jobs_with_seo.exclude(
-            models.Q(keywords__isnull=True) | models.Q(keywords='')
-        ).count()
-
-        # Jobs with structured data
-        jobs_with_structured_data = jobs_with_seo.exclude(
-            structured_data__isnull=True
-        ).count()
+        coverage_rate = (counts['jobs_with_seo'] / total_jobs * 100) if total_jobs > 0 else 0
 
         metrics = {
             'total_jobs': total_jobs,
-            'jobs_with_seo': jobs_with_seo.count(),
+            'jobs_with_seo': counts['jobs_with_seo'],
             'coverage_rate': round(coverage_rate, 2),
-            'titles_optimal_length': titles_optimal,
-            'descriptions_optimal_length': descriptions_optimal,
-            'jobs_with_keywords': jobs_with_keywords,
-            'jobs_with_structured_data': jobs_with_structured_data,
+            'titles_optimal_length': counts['titles_optimal'],
+            'descriptions_optimal_length': counts['descriptions_optimal'],
+            'jobs_with_keywords': counts['jobs_with_keywords'],
+            'jobs_with_structured_data': counts['jobs_with_structured_data'],
             'analysis_date': timezone.now().isoformat(),
         }
 
@@ -431,21 +775,14 @@ def optimize_existing_metadata():
     This task identifies and improves poorly performing SEO metadata.
     """
     from apps.jobs.models import JobPosting
-    from django.db.models import Q
 
     try:
-        # Find jobs with suboptimal SEO metadata
-        q_objects = (
-            Q(seo_title__regex=r'^.{0,39}$') |  # Title too short
-            Q(seo_title__regex=r'^.{61,}$') |   # Title too long
-            Q(seo_description__regex=r'^.{0,139}$') |  # Description too short
-            Q(seo_description__regex=r'^.{161,}$') |   # Description too long
-            Q(keywords__isnull=True) |
-            Q(keywords='')
-        )
+        # Find jobs with suboptimal SEO metadata; seo_quality is maintained
+        # on write and covered by a partial index on the flagged rows
         suboptimal_jobs = JobPosting.objects.filter(
-            status__in=['announced', 'admit_card', 'answer_key', 'result']
-        ).filter(q_objects)[:50]  # Limit to 50 jobs per run
+            status__in=_SITEMAP_ACTIVE_STATUSES,
+            seo_quality__gt=0
+        )[:50]  # Limit to 50 jobs per run
 
         logger.info(f"Found {suboptimal_jobs.count()} jobs with suboptimal SEO metadata")
 
@@ -469,3 +806,43 @@ def optimize_existing_metadata():
     except Exception as e:
         logger.error(f"SEO optimization failed: {e}")
         raise
+
+
+@shared_task(ignore_result=True)
+def record_audit_log(audit_type: str, status: str, details_json: str):
+    """
+    Persist an SEO audit log entry outside the request cycle.
+
+    Views enqueue this instead of inserting inline, so the audit write is
+    off the critical path of the API response. Details arrive pre-encoded
+    as JSON so datetimes and decimals in analysis payloads survive the
+    broker's JSON serializer.
+
+    Args:
+        audit_type: SEOAuditLog.audit_type value
+        status: SEOAuditLog.status value
+        details_json: JSON-encoded details payload
+    """
+    from apps.seo.models import SEOAuditLog
+
+    SEOAuditLog.objects.create(
+        audit_type=audit_type,
+        status=status,
+        details=json.loads(details_json)
+    )
+
+
+# Short and periodic: the next beat run replaces a lost one, so ack early
+@shared_task(ignore_result=True, acks_late=False)
+def refresh_trending_keywords():
+    """
+    Refresh the trending keywords materialized view.
+
+    Runs every 10 minutes from Celery beat. A no-op on databases other
+    than PostgreSQL, where trending keywords are aggregated on request.
+    """
+    if connection.vendor != 'postgresql':
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute('REFRESH MATERIALIZED VIEW CONCURRENTLY mv_trending_keywords')
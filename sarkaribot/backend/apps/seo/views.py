@@ -5,13 +5,19 @@ Implements comprehensive SEO management functionality including metadata generat
 keyword tracking, sitemap management, and SEO analytics according to Knowledge.md specifications.
 """
 
+import json
 import logging
 from typing import Dict, Any
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.db import connection
 from django.shortcuts import get_object_or_404
-from django.db.models import Count, Q
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated, AllowAny
@@ -20,18 +26,66 @@ from rest_framework import filters
 
 from .models import SEOMetadata, KeywordTracking, SitemapEntry, SEOAuditLog
 from .serializers import (
+    SEOMetadataListSerializer,
     SEOMetadataSerializer,
     KeywordTrackingSerializer, 
     SitemapEntrySerializer,
     SEOAuditLogSerializer
 )
-from .engine import NLPSEOEngine
+from apps.core.caching import AGGREGATE_CACHE_TIMEOUT, CachedListMixin
+from .tasks import generate_seo_metadata_cached, iter_sitemap_xml, record_audit_log
 from apps.jobs.models import JobPosting
 
 logger = logging.getLogger(__name__)
 
+# SEO scoring rules as (predicate, points). Predicates take
+# (title_length, description_length, keywords, has_structured_data).
+SEO_SCORE_RULES = (
+    (lambda tl, dl, kw, sd: 50 <= tl <= 60, 25),
+    (lambda tl, dl, kw, sd: 150 <= dl <= 160, 25),
+    (lambda tl, dl, kw, sd: bool(kw), 25),
+    (lambda tl, dl, kw, sd: bool(sd), 25),
+)
+
+# Recommendations as (predicate, message), same predicate arguments
+SEO_RECOMMENDATION_RULES = (
+    (lambda tl, dl, kw, sd: tl < 50, 'SEO title is too short. Aim for 50-60 characters.'),
+    (lambda tl, dl, kw, sd: tl > 60, 'SEO title is too long. Keep it under 60 characters.'),
+    (lambda tl, dl, kw, sd: dl < 150, 'Meta description is too short. Aim for 150-160 characters.'),
+    (lambda tl, dl, kw, sd: dl > 160, 'Meta description is too long. Keep it under 160 characters.'),
+    (lambda tl, dl, kw, sd: not kw, 'Add relevant keywords for better SEO.'),
+    (lambda tl, dl, kw, sd: not sd, 'Add structured data (JSON-LD) for better search visibility.'),
+)
+
+
+def _log_audit(audit_type: str, status: str, details: Dict[str, Any]) -> None:
+    """
+    Queue an SEO audit log write instead of inserting it inline.
+
+    Dispatch failures (e.g. the broker being down) are logged and never
+    change the response of the calling view.
+    """
+    try:
+        record_audit_log.delay(audit_type, status, json.dumps(details, cls=DjangoJSONEncoder))
+    except Exception:
+        logger.exception(f"Failed to queue SEO audit log ({audit_type}, {status})")
+
 
-class SEOMetadataViewSet(viewsets.ModelViewSet):
+class SEOCursorPagination(CursorPagination):
+    """
+    Cursor pagination on the most recently updated rows.
+
+    Each page is a range scan on the updated_at index instead of an
+    OFFSET that reads and discards every earlier row.
+    """
+
+    ordering = '-updated_at'
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class SEOMetadataViewSet(CachedListMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing SEO metadata.
     
@@ -43,10 +97,17 @@ class SEOMetadataViewSet(viewsets.ModelViewSet):
     serializer_class = SEOMetadataSerializer
     permission_classes = [AllowAny]  # Adjust as needed
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['content_type', 'page_type']
-    search_fields = ['seo_title', 'seo_description', 'keywords']
+    filterset_fields = ['content_type']
+    search_fields = ['title', 'description', 'keywords']
     ordering_fields = ['created_at', 'updated_at']
     ordering = ['-updated_at']
+    pagination_class = SEOCursorPagination
+    
+    def get_serializer_class(self):
+        """Use the lightweight serializer for list pages."""
+        if self.action == 'list':
+            return SEOMetadataListSerializer
+        return SEOMetadataSerializer
     
     def get_queryset(self):
         """Filter queryset based on query parameters."""
@@ -56,28 +117,32 @@ class SEOMetadataViewSet(viewsets.ModelViewSet):
         content_type = self.request.query_params.get('content_type')
         if content_type:
             queryset = queryset.filter(content_type=content_type)
+        
+        # List pages only load the columns their serializer renders
+        if self.action == 'list':
+            queryset = queryset.only(*SEOMetadataListSerializer.Meta.fields)
             
-        return queryset.select_related('content_type')
+        return queryset
     
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """Get SEO metadata statistics."""
-        total_metadata = self.get_queryset().count()
-        by_type = dict(
-            self.get_queryset()
-            .values('page_type')
-            .annotate(count=Count('id'))
-            .values_list('page_type', 'count')
-        )
+        def build():
+            # One grouped query; the total is summed from the group counts
+            by_type = {}
+            grouped = self.get_queryset().values('content_type').annotate(count=Count('id')).order_by()
+            for row in grouped.iterator(chunk_size=2000):
+                by_type[row['content_type']] = row['count']
+            return {
+                'total_metadata': sum(by_type.values()),
+                'by_type': by_type,
+                'last_updated': timezone.now()
+            }
         
-        return Response({
-            'total_metadata': total_metadata,
-            'by_type': by_type,
-            'last_updated': timezone.now()
-        })
+        return Response(self.get_cached_data(request, 'stats', build, AGGREGATE_CACHE_TIMEOUT))
 
 
-class KeywordTrackingViewSet(viewsets.ModelViewSet):
+class KeywordTrackingViewSet(CachedListMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing keyword tracking.
     
@@ -88,25 +153,44 @@ class KeywordTrackingViewSet(viewsets.ModelViewSet):
     serializer_class = KeywordTrackingSerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['keyword', 'job_posting']
+    filterset_fields = ['keyword', 'is_target_keyword']
     search_fields = ['keyword']
-    ordering_fields = ['frequency', 'created_at']
-    ordering = ['-frequency']
+    ordering_fields = ['current_position', 'search_volume', 'created_at']
+    ordering = ['-created_at']
+    
+    def get_serializer(self, *args, **kwargs):
+        """Accept a list payload on create and insert it in bulk."""
+        if isinstance(kwargs.get('data'), list):
+            kwargs['many'] = True
+        return super().get_serializer(*args, **kwargs)
     
     @action(detail=False, methods=['get'])
     def trending(self, request):
         """Get trending keywords."""
-        trending_keywords = (
-            self.get_queryset()
-            .values('keyword')
-            .annotate(total_frequency=Count('id'))
-            .order_by('-total_frequency')[:10]
-        )
+        def build():
+            if connection.vendor == 'postgresql':
+                # Pre-aggregated by refresh_trending_keywords
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        'SELECT keyword, total_frequency FROM mv_trending_keywords '
+                        'ORDER BY total_frequency DESC LIMIT 10'
+                    )
+                    return [
+                        {'keyword': keyword, 'total_frequency': total_frequency}
+                        for keyword, total_frequency in cursor.fetchall()
+                    ]
+            
+            return list(
+                self.get_queryset()
+                .values('keyword')
+                .annotate(total_frequency=Count('id'))
+                .order_by('-total_frequency')[:10]
+            )
         
-        return Response(trending_keywords)
+        return Response(self.get_cached_data(request, 'trending', build, AGGREGATE_CACHE_TIMEOUT))
 
 
-class SitemapEntryViewSet(viewsets.ModelViewSet):
+class SitemapEntryViewSet(CachedListMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing sitemap entries.
     
@@ -117,21 +201,26 @@ class SitemapEntryViewSet(viewsets.ModelViewSet):
     serializer_class = SitemapEntrySerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_fields = ['url_type', 'priority']
-    ordering_fields = ['priority', 'last_modified']
-    ordering = ['-priority', '-last_modified']
+    filterset_fields = ['is_active', 'priority']
+    ordering_fields = ['created_at', 'updated_at']
+    ordering = ['-updated_at']
+    pagination_class = SEOCursorPagination
     
     @action(detail=False, methods=['get'])
     def generate(self, request):
-        """Generate sitemap entries for all content."""
+        """Stream the XML sitemap for all active entries."""
         try:
-            # This would integrate with the sitemap generation logic
-            count = self.get_queryset().count()
-            return Response({
-                'message': 'Sitemap generation completed',
-                'total_entries': count,
-                'timestamp': timezone.now()
-            })
+            # iterator() reads through a server-side cursor on PostgreSQL,
+            # so neither the rows nor the XML are ever fully in memory
+            rows = (
+                SitemapEntry.objects.filter(is_active=True)
+                .values_list('url', 'last_modified', 'change_frequency', 'priority')
+                .iterator(chunk_size=1000)
+            )
+            return StreamingHttpResponse(
+                iter_sitemap_xml(self._iter_entries(rows)),
+                content_type='application/xml'
+            )
         except Exception as e:
             logger.error(f"Sitemap generation failed: {e}")
             return Response(
@@ -139,8 +228,19 @@ class SitemapEntryViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @staticmethod
+    def _iter_entries(rows):
+        """Convert sitemap entry rows into sitemap entry dictionaries."""
+        for url, last_modified, change_frequency, priority in rows:
+            yield {
+                'url': url,
+                'lastmod': last_modified.strftime('%Y-%m-%d') if last_modified else '',
+                'changefreq': change_frequency,
+                'priority': str(priority),
+            }
+
 
-class SEOAuditLogViewSet(viewsets.ReadOnlyModelViewSet):
+class SEOAuditLogViewSet(CachedListMixin, viewsets.ReadOnlyModelViewSet):
     """
     Read-only ViewSet for SEO audit logs.
     
@@ -151,37 +251,33 @@ class SEOAuditLogViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = SEOAuditLogSerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_fields = ['action_type', 'status']
+    filterset_fields = ['audit_type', 'status']
     ordering_fields = ['created_at']
     ordering = ['-created_at']
     
     @action(detail=False, methods=['get'])
     def summary(self, request):
         """Get audit log summary."""
-        logs = self.get_queryset()
-        
-        # Get counts by action type
-        by_action = dict(
-            logs.values('action_type')
-            .annotate(count=Count('id'))
-            .values_list('action_type', 'count')
-        )
-        
-        # Get counts by status
-        by_status = dict(
-            logs.values('status')
-            .annotate(count=Count('id'))
-            .values_list('status', 'count')
-        )
+        def build():
+            logs = self.get_queryset()
+            
+            # Count by audit type and status in one grouped query, then roll up
+            by_action = {}
+            by_status = {}
+            for row in logs.values('audit_type', 'status').annotate(count=Count('id')).order_by():
+                by_action[row['audit_type']] = by_action.get(row['audit_type'], 0) + row['count']
+                by_status[row['status']] = by_status.get(row['status'], 0) + row['count']
+            
+            return {
+                'total_logs': sum(by_action.values()),
+                'by_action': by_action,
+                'by_status': by_status,
+                'recent_activity': list(logs[:5].values(
+                    'audit_type', 'status', 'created_at'
+                ))
+            }
         
-        return Response({
-            'total_logs': logs.count(),
-            'by_action': by_action,
-            'by_status': by_status,
-            'recent_activity': logs[:5].values(
-                'action_type', 'status', 'created_at'
-            )
-        })
+        return Response(self.get_cached_data(request, 'summary', build, AGGREGATE_CACHE_TIMEOUT))
 
 
 class SEOGenerateView(APIView):
@@ -208,13 +304,10 @@ class SEOGenerateView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Initialize SEO engine
-            seo_engine = NLPSEOEngine()
-            
             # Get job data if job_id provided
             if job_id:
                 try:
-                    job = JobPosting.objects.get(id=job_id)
+                    job = JobPosting.objects.select_related('category', 'source').get(id=job_id)
                     job_data = {
                         'title': job.title,
                         'description': job.description,
@@ -236,14 +329,14 @@ class SEOGenerateView(APIView):
                     'last_date': request.data.get('last_date', '')
                 }
             
-            # Generate metadata
-            metadata = seo_engine.generate_seo_metadata(job_data)
+            # Generate metadata; resubmitted content is served from the cache
+            metadata = generate_seo_metadata_cached(job_data)
             
             # Log the action
-            SEOAuditLog.objects.create(
-                action_type='metadata_generation',
-                details={'job_data': job_data, 'generated_metadata': metadata},
-                status='success'
+            _log_audit(
+                'metadata_generation',
+                'success',
+                {'job_data': job_data, 'generated_metadata': metadata}
             )
             
             return Response({
@@ -255,10 +348,10 @@ class SEOGenerateView(APIView):
             logger.error(f"SEO metadata generation failed: {e}")
             
             # Log the error
-            SEOAuditLog.objects.create(
-                action_type='metadata_generation',
-                details={'error': str(e), 'request_data': request.data},
-                status='error'
+            _log_audit(
+                'metadata_generation',
+                'error',
+                {'error': str(e), 'request_data': request.data}
             )
             
             return Response(
@@ -301,77 +394,56 @@ class SEOAnalyzeView(APIView):
             
             # Get job-specific analysis
             if job_id:
-                try:
-                    job = JobPosting.objects.get(id=job_id)
-                    
-                    # Analyze metadata
-                    seo_metadata = SEOMetadata.objects.filter(
-                        object_id=job_id
-                    ).first()
-                    
-                    if seo_metadata:
-                        analysis['metadata_analysis'] = {
-                            'title_length': len(seo_metadata.seo_title),
-                            'description_length': len(seo_metadata.seo_description),
-                            'keywords_count': len(seo_metadata.keywords.split(',')) if seo_metadata.keywords else 0,
-                            'has_structured_data': bool(seo_metadata.structured_data)
-                        }
-                        
-                        # Calculate SEO score
-                        score = 0
-                        if 50 <= len(seo_metadata.seo_title) <= 60:
-                            score += 25
-                        if 150 <= len(seo_metadata.seo_description) <= 160:
-                            score += 25
-                        if seo_metadata.keywords:
-                            score += 25
-                        if seo_metadata.structured_data:
-                            score += 25
-                        
-                        analysis['seo_score'] = score
-                        
-                        # Generate recommendations
-                        if len(seo_metadata.seo_title) < 50:
-                            analysis['recommendations'].append('SEO title is too short. Aim for 50-60 characters.')
-                        elif len(seo_metadata.seo_title) > 60:
-                            analysis['recommendations'].append('SEO title is too long. Keep it under 60 characters.')
-                        
-                        if len(seo_metadata.seo_description) < 150:
-                            analysis['recommendations'].append('Meta description is too short. Aim for 150-160 characters.')
-                        elif len(seo_metadata.seo_description) > 160:
-                            analysis['recommendations'].append('Meta description is too long. Keep it under 160 characters.')
-                        
-                        if not seo_metadata.keywords:
-                            analysis['recommendations'].append('Add relevant keywords for better SEO.')
-                        
-                        if not seo_metadata.structured_data:
-                            analysis['recommendations'].append('Add structured data (JSON-LD) for better search visibility.')
-                    
-                    else:
-                        analysis['recommendations'].append('No SEO metadata found. Generate metadata for this job posting.')
-                        
-                except JobPosting.DoesNotExist:
+                job = self._get_job_analysis_row(job_id)
+                if job is None:
                     return Response(
                         {'error': 'Job not found'},
                         status=status.HTTP_404_NOT_FOUND
                     )
-            
-            # Get keyword analysis
-            if job_id:
-                keywords = KeywordTracking.objects.filter(job_posting_id=job_id)
-                analysis['keyword_analysis'] = {
-                    'total_keywords': keywords.count(),
-                    'top_keywords': list(
-                        keywords.order_by('-frequency')[:5]
-                        .values_list('keyword', flat=True)
+                
+                if job['metadata_id'] is not None:
+                    title_length = job['title_length']
+                    description_length = job['description_length']
+                    keyword_count = job['keyword_count']
+                    has_structured_data = job['has_structured_data']
+                    
+                    analysis['metadata_analysis'] = {
+                        'title_length': title_length,
+                        'description_length': description_length,
+                        'keywords_count': keyword_count,
+                        'has_structured_data': has_structured_data
+                    }
+                    
+                    # Score and recommend from the rule tables
+                    facts = (title_length, description_length, keyword_count, has_structured_data)
+                    analysis['seo_score'] = sum(
+                        points for rule, points in SEO_SCORE_RULES if rule(*facts)
+                    )
+                    analysis['recommendations'].extend(
+                        message for rule, message in SEO_RECOMMENDATION_RULES if rule(*facts)
+                    )
+                
+                else:
+                    analysis['recommendations'].append('No SEO metadata found. Generate metadata for this job posting.')
+                
+                # Keywords tracked for the job's canonical URL
+                top_keywords = []
+                if job['tracked_keywords']:
+                    top_keywords = list(
+                        KeywordTracking.objects.filter(target_url=job['metadata_canonical_url'])
+                        .order_by(F('search_volume').desc(nulls_last=True))
+                        .values_list('keyword', flat=True)[:5]
                     )
+                analysis['keyword_analysis'] = {
+                    'total_keywords': job['tracked_keywords'],
+                    'top_keywords': top_keywords
                 }
             
             # Log the analysis
-            SEOAuditLog.objects.create(
-                action_type='seo_analysis',
-                details={'analysis_params': {'job_id': job_id, 'url': url}, 'results': analysis},
-                status='success'
+            _log_audit(
+                'performance_check',
+                'success',
+                {'analysis_params': {'job_id': job_id, 'url': url}, 'results': analysis}
             )
             
             return Response(analysis)
@@ -380,13 +452,60 @@ class SEOAnalyzeView(APIView):
             logger.error(f"SEO analysis failed: {e}")
             
             # Log the error
-            SEOAuditLog.objects.create(
-                action_type='seo_analysis',
-                details={'error': str(e), 'params': request.query_params.dict()},
-                status='error'
+            _log_audit(
+                'performance_check',
+                'error',
+                {'error': str(e), 'params': request.query_params.dict()}
             )
             
             return Response(
                 {'error': 'SEO analysis failed'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+    
+    @staticmethod
+    def _get_job_analysis_row(job_id):
+        """
+        Fetch a job with its SEO metadata columns and tracked keyword count.
+        
+        Everything the analysis reads comes back in one row from one query,
+        with the metadata and keyword count as correlated subqueries.
+        
+        Args:
+            job_id: JobPosting primary key
+            
+        Returns:
+            Dictionary of analysis columns, or None if the job does not exist
+        """
+        metadata = SEOMetadata.objects.filter(
+            content_type='job_posting', content_id=OuterRef('pk')
+        ).order_by()
+        
+        def metadata_value(field):
+            return Subquery(metadata.values(field)[:1])
+        
+        # Blank target URLs never match, so a job without a canonical URL
+        # does not count every untargeted keyword
+        tracked = (
+            KeywordTracking.objects.filter(target_url=OuterRef('metadata_canonical_url'))
+            .exclude(target_url='')
+            .order_by().values('target_url').annotate(total=Count('id')).values('total')
+        )
+        
+        return (
+            JobPosting.objects.filter(pk=job_id)
+            .annotate(
+                metadata_id=metadata_value('id'),
+                title_length=metadata_value('title_length'),
+                description_length=metadata_value('description_length'),
+                keyword_count=metadata_value('keyword_count'),
+                has_structured_data=metadata_value('has_structured_data'),
+                metadata_canonical_url=metadata_value('canonical_url'),
+            )
+            .annotate(tracked_keywords=Coalesce(Subquery(tracked), 0))
+            .values(
+                'metadata_id', 'title_length', 'description_length', 'keyword_count',
+                'has_structured_data', 'metadata_canonical_url', 'tracked_keywords'
+            )
+            .first()
+        )
@@ -11,3 +11,7 @@ class SourcesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.sources'
     verbose_name = 'Government Sources'
+    
+    def ready(self):
+        """Initialize app when Django starts."""
+        import apps.sources.signals
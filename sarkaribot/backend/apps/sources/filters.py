@@ -0,0 +1,25 @@
+"""
+Django filters for government sources API.
+"""
+
+import django_filters
+
+from .models import SourceStatistics
+
+
+class SourceStatisticsFilter(django_filters.FilterSet):
+    """
+    Filter set for daily source statistics.
+
+    Dates are filtered by range with date_after and date_before
+    (both inclusive); pass the same day to both for a single date.
+    """
+
+    date = django_filters.DateFromToRangeFilter(
+        field_name='date',
+        help_text="Filter by statistics date range"
+    )
+
+    class Meta:
+        model = SourceStatistics
+        fields = ['source', 'date']
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.14 on 2026-10-17 02:03
+
+from datetime import timedelta
+
+from django.db import migrations, models
+
+
+def backfill_next_scrape_at(apps, schema_editor):
+    """Derive next_scrape_at from last_scraped for existing sources."""
+    GovernmentSource = apps.get_model('sources', 'GovernmentSource')
+    sources = GovernmentSource.objects.filter(last_scraped__isnull=False)
+    for source in sources.only('id', 'last_scraped', 'scrape_frequency').iterator():
+        source.next_scrape_at = source.last_scraped + timedelta(hours=source.scrape_frequency)
+        source.save(update_fields=['next_scrape_at'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sources', '0002_remove_governmentsource_sources_gov_active_950c14_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='governmentsource',
+            name='next_scrape_at',
+            field=models.DateTimeField(blank=True, help_text='When this source is next due for scraping', null=True),
+        ),
+        migrations.RunPython(backfill_next_scrape_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='governmentsource',
+            index=models.Index(condition=models.Q(('is_active', True), ('status', 'active')), fields=['next_scrape_at'], name='sources_gov_due_idx'),
+        ),
+    ]
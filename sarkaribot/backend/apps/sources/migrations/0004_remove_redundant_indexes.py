@@ -0,0 +1,25 @@
+# Generated by Django 4.2.14 on 2026-10-17 02:03
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sources', '0003_governmentsource_next_scrape_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='governmentsource',
+            name='sources_gov_name_e8a724_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='governmentsource',
+            name='sources_gov_is_acti_21b179_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='sourcestatistics',
+            name='sources_sou_source__041ea0_idx',
+        ),
+    ]
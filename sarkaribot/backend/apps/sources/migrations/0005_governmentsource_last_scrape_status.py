@@ -0,0 +1,34 @@
+# Generated by Django 4.2.14 on 2026-10-17 02:17
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_last_scrape_status(apps, schema_editor):
+    """Copy the status of each source's most recent scrape log."""
+    GovernmentSource = apps.get_model('sources', 'GovernmentSource')
+    ScrapeLog = apps.get_model('scraping', 'ScrapeLog')
+    latest_status = ScrapeLog.objects.filter(
+        source=OuterRef('pk')
+    ).order_by('-started_at').values('status')[:1]
+    GovernmentSource.objects.update(
+        last_scrape_status=Coalesce(Subquery(latest_status), models.Value('unknown'))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sources', '0004_remove_redundant_indexes'),
+        ('scraping', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='governmentsource',
+            name='last_scrape_status',
+            field=models.CharField(default='unknown', editable=False, help_text='Status of the most recent scrape log, kept in sync by ScrapeLog', max_length=20),
+        ),
+        migrations.RunPython(backfill_last_scrape_status, migrations.RunPython.noop),
+    ]
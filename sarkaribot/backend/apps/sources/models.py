@@ -6,14 +6,73 @@ that will be scraped for job postings.
 """
 
 from django.db import models
+from django.db.models import Count, F, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.core.validators import URLValidator
 from django.utils import timezone
+from django.utils.functional import cached_property
+from apps.core.caching import invalidate_list_cache
 from apps.core.models import TimestampedModel
+from datetime import timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class GovernmentSourceQuerySet(models.QuerySet):
+    """QuerySet for GovernmentSource with list-view annotations."""
+
+    def due_for_scraping(self):
+        """
+        Filter to active sources whose next scheduled scrape has arrived.
+
+        Sources that have never been scraped have no next_scrape_at and are
+        always due. Served by the partial index on next_scrape_at.
+
+        Returns:
+            QuerySet of sources that should be scraped now
+        """
+        return self.filter(
+            Q(next_scrape_at__isnull=True) | Q(next_scrape_at__lte=timezone.now()),
+            is_active=True,
+            status='active',
+        )
+
+    def with_30d_metrics(self):
+        """
+        Annotate each source with its last-30-day job and scrape totals.
+
+        Each metric is a correlated subquery, so a list of N sources is
+        fetched in one statement instead of one query per source and metric.
+        The per-source helper methods read these annotations when present.
+
+        Returns:
+            QuerySet annotated with jobs_count_30d, stats_attempted_30d,
+            stats_successful_30d and stats_jobs_found_30d
+        """
+        from apps.jobs.models import JobPosting
+
+        now = timezone.now()
+        stats = SourceStatistics.objects.filter(
+            source=OuterRef('pk'),
+            date__gte=now.date() - timedelta(days=30)
+        ).order_by().values('source')
+        jobs = JobPosting.objects.filter(
+            source=OuterRef('pk'),
+            created_at__gte=now - timedelta(days=30)
+        ).order_by().values('source')
+
+        def stats_total(field):
+            return Coalesce(Subquery(stats.annotate(total=Sum(field)).values('total')), 0)
+
+        return self.annotate(
+            jobs_count_30d=Coalesce(Subquery(jobs.annotate(total=Count('id')).values('total')), 0),
+            stats_attempted_30d=stats_total('scrapes_attempted'),
+            stats_successful_30d=stats_total('scrapes_successful'),
+            stats_jobs_found_30d=stats_total('jobs_found'),
+        )
+
+
 class GovernmentSource(TimestampedModel):
     """
     Model representing a government website source for job postings.
@@ -77,10 +136,21 @@ class GovernmentSource(TimestampedModel):
         blank=True,
         help_text="Last time this source was successfully scraped"
     )
+    next_scrape_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When this source is next due for scraping"
+    )
     last_error = models.TextField(
         blank=True,
         help_text="Last error message encountered during scraping"
     )
+    last_scrape_status = models.CharField(
+        max_length=20,
+        default='unknown',
+        editable=False,
+        help_text="Status of the most recent scrape log, kept in sync by ScrapeLog"
+    )
     total_jobs_found = models.PositiveIntegerField(
         default=0,
         help_text="Total number of jobs found from this source"
@@ -92,12 +162,17 @@ class GovernmentSource(TimestampedModel):
         help_text="JSON configuration for scraping this source"
     )
 
+    objects = GovernmentSourceQuerySet.as_manager()
+
     class Meta:
         ordering = ['name']
         indexes = [
-            models.Index(fields=['name']),
-            models.Index(fields=['is_active', 'status']),
             models.Index(fields=['last_scraped']),
+            models.Index(
+                fields=['next_scrape_at'],
+                name='sources_gov_due_idx',
+                condition=Q(is_active=True, status='active'),
+            ),
         ]
         verbose_name = 'Government Source'
         verbose_name_plural = 'Government Sources'
@@ -105,6 +180,18 @@ class GovernmentSource(TimestampedModel):
     def __str__(self) -> str:
         return f"{self.display_name} ({self.name})"
 
+    def save(self, *args, **kwargs):
+        """Derive next_scrape_at from last_scraped and scrape_frequency."""
+        self.next_scrape_at = (
+            self.get_next_scrape_at(self.last_scraped) if self.last_scraped else None
+        )
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'last_scraped', 'scrape_frequency'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'next_scrape_at'}
+
+        super().save(*args, **kwargs)
+
     def is_due_for_scraping(self) -> bool:
         """
         Check if this source is due for scraping based on frequency.
@@ -115,31 +202,54 @@ class GovernmentSource(TimestampedModel):
         if not self.is_active or self.status != 'active':
             return False
 
-        if not self.last_scraped:
+        if not self.next_scrape_at:
             return True
 
-        time_since_last_scrape = timezone.now() - self.last_scraped
-        return time_since_last_scrape.total_seconds() >= (self.scrape_frequency * 3600)
+        return timezone.now() >= self.next_scrape_at
+
+    def get_next_scrape_at(self, scraped_at):
+        """
+        Compute when this source is next due, given a completed scrape time.
+
+        Args:
+            scraped_at: Time the last scrape completed
+
+        Returns:
+            Datetime of the next scheduled scrape
+        """
+        return scraped_at + timedelta(hours=self.scrape_frequency)
 
     def mark_scrape_started(self):
         """Mark that scraping has started for this source."""
         self.status = 'active'
         self.last_error = ''
-        self.save(update_fields=['status', 'last_error'])
+        type(self).objects.filter(pk=self.pk).update(status='active', last_error='')
         logger.info(f"Started scraping {self.name}")
 
     def mark_scrape_completed(self, jobs_found: int = 0):
         """
         Mark that scraping has completed successfully.
 
+        The job total is incremented in the database so concurrent
+        scrapers of the same source cannot lose each other's updates.
+
         Args:
             jobs_found: Number of jobs found in this scrape
         """
-        self.last_scraped = timezone.now()
+        now = timezone.now()
+        next_scrape_at = self.get_next_scrape_at(now)
+        type(self).objects.filter(pk=self.pk).update(
+            last_scraped=now,
+            next_scrape_at=next_scrape_at,
+            status='active',
+            last_error='',
+            total_jobs_found=F('total_jobs_found') + jobs_found
+        )
+        self.last_scraped = now
+        self.next_scrape_at = next_scrape_at
         self.status = 'active'
         self.last_error = ''
         self.total_jobs_found += jobs_found
-        self.save(update_fields=['last_scraped', 'status', 'last_error', 'total_jobs_found'])
         logger.info(f"Completed scraping {self.name}: {jobs_found} jobs found")
 
     def mark_scrape_error(self, error_message: str):
@@ -151,7 +261,7 @@ class GovernmentSource(TimestampedModel):
         """
         self.status = 'error'
         self.last_error = error_message
-        self.save(update_fields=['status', 'last_error'])
+        type(self).objects.filter(pk=self.pk).update(status='error', last_error=error_message)
         logger.error(f"Scraping error for {self.name}: {error_message}")
 
     def get_scraping_config(self) -> dict:
@@ -176,9 +286,32 @@ class GovernmentSource(TimestampedModel):
 
         return default_config
 
+    @cached_property
+    def scraping_public_config(self) -> dict:
+        """
+        Public, non-sensitive summary of the scraping configuration.
+
+        Built once per instance, so serializing the same source repeatedly
+        does not re-walk config_json. Not refreshed if config_json is
+        changed on the same instance.
+
+        Returns:
+            Dictionary safe to expose through the API
+        """
+        config = self.get_scraping_config()
+        return {
+            'scrape_frequency_hours': self.scrape_frequency,
+            'is_active': self.is_active,
+            'supports_pagination': bool(config['pagination']),
+            'javascript_required': bool(config['use_headless_browser']),
+            'request_delay': config['request_delay'],
+        }
+
     def get_jobs_count_last_30_days(self) -> int:
         """Get number of jobs found from this source in last 30 days."""
-        from datetime import timedelta
+        if 'jobs_count_30d' in self.__dict__:
+            return self.jobs_count_30d
+
         from apps.jobs.models import JobPosting
 
         thirty_days_ago = timezone.now() - timedelta(days=30)
@@ -187,15 +320,29 @@ class GovernmentSource(TimestampedModel):
             created_at__gte=thirty_days_ago
         ).count()
 
-    def get_success_rate_last_30_days(self) -> float:
-        """Get success rate for scraping in last 30 days."""
-        from datetime import timedelta
+    @cached_property
+    def _stats_summary_30d(self) -> dict:
+        """Scrape totals for the last 30 days, aggregated in one query."""
+        if 'stats_attempted_30d' in self.__dict__:
+            # Annotated by GovernmentSourceQuerySet.with_30d_metrics()
+            return {
+                'attempted': self.stats_attempted_30d,
+                'successful': self.stats_successful_30d,
+                'jobs': self.stats_jobs_found_30d,
+            }
 
         thirty_days_ago = timezone.now().date() - timedelta(days=30)
-        stats = self.statistics.filter(date__gte=thirty_days_ago)
+        return self.statistics.filter(date__gte=thirty_days_ago).aggregate(
+            attempted=Sum('scrapes_attempted'),
+            successful=Sum('scrapes_successful'),
+            jobs=Sum('jobs_found')
+        )
 
-        total_attempts = sum(s.scrapes_attempted for s in stats)
-        total_successful = sum(s.scrapes_successful for s in stats)
+    def get_success_rate_last_30_days(self) -> float:
+        """Get success rate for scraping in last 30 days."""
+        stats = self._stats_summary_30d
+        total_attempts = stats['attempted'] or 0
+        total_successful = stats['successful'] or 0
 
         if total_attempts == 0:
             return 0.0
@@ -203,13 +350,9 @@ class GovernmentSource(TimestampedModel):
 
     def get_avg_jobs_per_scrape(self) -> float:
         """Get average number of jobs found per scrape."""
-        from datetime import timedelta
-
-        thirty_days_ago = timezone.now().date() - timedelta(days=30)
-        stats = self.statistics.filter(date__gte=thirty_days_ago)
-
-        total_scrapes = sum(s.scrapes_successful for s in stats)
-        total_jobs = sum(s.jobs_found for s in stats)
+        stats = self._stats_summary_30d
+        total_scrapes = stats['successful'] or 0
+        total_jobs = stats['jobs'] or 0
 
         if total_scrapes == 0:
             return 0.0
@@ -255,6 +398,44 @@ class SourceCategory(TimestampedModel):
         return self.name
 
 
+class SourceStatisticsQuerySet(models.QuerySet):
+    """QuerySet for SourceStatistics with batched write helpers."""
+
+    UPSERT_FIELDS = [
+        'scrapes_attempted', 'scrapes_successful', 'scrapes_failed',
+        'jobs_found', 'jobs_updated', 'average_response_time',
+        'total_pages_scraped', 'updated_at',
+    ]
+
+    def bulk_upsert(self, rows, batch_size: int = 500) -> int:
+        """
+        Insert or update daily statistics rows in batched upserts.
+
+        Rows conflicting on (source, date) overwrite the existing metrics,
+        so N sources are written with one INSERT ... ON CONFLICT per batch
+        instead of a lookup and write per source.
+
+        Args:
+            rows: Iterable of dicts of SourceStatistics field values,
+                each including source_id and date
+            batch_size: Number of rows per INSERT statement
+
+        Returns:
+            Number of rows written
+        """
+        objs = [self.model(**row) for row in rows]
+        self.bulk_create(
+            objs,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['source', 'date'],
+            update_fields=self.UPSERT_FIELDS,
+        )
+        # bulk_create skips post_save, so drop cached summaries here
+        invalidate_list_cache(self.model)
+        return len(objs)
+
+
 class SourceStatistics(TimestampedModel):
     """
     Daily statistics for government sources.
@@ -306,11 +487,12 @@ class SourceStatistics(TimestampedModel):
         help_text="Total pages scraped"
     )
 
+    objects = SourceStatisticsQuerySet.as_manager()
+
     class Meta:
         unique_together = ['source', 'date']
         ordering = ['-date']
         indexes = [
-            models.Index(fields=['source', 'date']),
             models.Index(fields=['date']),
         ]
         verbose_name = 'Source Statistics'
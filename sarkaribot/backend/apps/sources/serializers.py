@@ -5,20 +5,46 @@ Provides serialization for government source data and statistics
 according to Knowledge.md specifications.
 """
 
+import copy
+
 from rest_framework import serializers
 from typing import Dict, Any
+from django.db.models import Avg, Count, Q, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
+from django.utils.functional import cached_property
 from datetime import timedelta
 
 from .models import GovernmentSource, SourceStatistics
 
+# Built fields per serializer class, see CachedFieldsMixin
+_SERIALIZER_FIELDS_CACHE: Dict[type, Dict[str, serializers.Field]] = {}
+
+
+class CachedFieldsMixin:
+    """
+    Build a ModelSerializer's fields once per class.
+
+    ModelSerializer.get_fields() introspects the model and constructs
+    every field each time a serializer is instantiated. The result only
+    depends on the class, so it is built once and each instance gets a
+    deep copy, which re-creates the fields from their constructor
+    arguments. Only for serializers whose fields do not depend on context.
+    """
 
-class GovernmentSourceSerializer(serializers.ModelSerializer):
+    def get_fields(self):
+        cls = type(self)
+        fields = _SERIALIZER_FIELDS_CACHE.get(cls)
+        if fields is None:
+            fields = _SERIALIZER_FIELDS_CACHE[cls] = super().get_fields()
+        return copy.deepcopy(fields)
+
+
+class GovernmentSourceSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Basic serializer for government sources."""
 
     # Computed fields
     jobs_count = serializers.SerializerMethodField()
-    last_scrape_status = serializers.SerializerMethodField()
     next_scrape_time = serializers.SerializerMethodField()
 
     class Meta:
@@ -29,27 +55,27 @@ class GovernmentSourceSerializer(serializers.ModelSerializer):
             'last_scraped', 'jobs_count', 'last_scrape_status',
             'next_scrape_time', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['created_at', 'updated_at']
+        read_only_fields = ['last_scrape_status', 'created_at', 'updated_at']
 
     def get_jobs_count(self, obj) -> int:
         """Get total number of jobs from this source."""
+        # Annotated by GovernmentSourceViewSet.get_queryset()
+        if hasattr(obj, 'jobs_count'):
+            return obj.jobs_count
         return obj.job_postings.count()
 
-    def get_last_scrape_status(self, obj) -> str:
-        """Get status of last scraping attempt."""
-        # Get most recent scrape log
-        recent_log = obj.scrape_logs.first()
-        if recent_log:
-            return recent_log.status
-        return 'unknown'
+    @cached_property
+    def _now(self):
+        """Current time, taken once per serializer (and so once per list)."""
+        return timezone.now()
 
     def get_next_scrape_time(self, obj) -> str:
         """Calculate next scheduled scrape time."""
         if not obj.last_scraped:
             return 'pending'
 
-        next_scrape = obj.last_scraped + timedelta(hours=obj.scrape_frequency)
-        if next_scrape <= timezone.now():
+        next_scrape = obj.next_scrape_at or obj.get_next_scrape_at(obj.last_scraped)
+        if next_scrape <= self._now:
             return 'overdue'
 
         return next_scrape.isoformat()
@@ -70,86 +96,54 @@ class GovernmentSourceDetailSerializer(GovernmentSourceSerializer):
 
     def get_recent_statistics(self, obj) -> Dict[str, Any]:
         """Get recent performance statistics."""
-        # Get last 7 days of statistics
-        week_ago = timezone.now() - timedelta(days=7)
-        recent_stats = obj.statistics.filter(date__gte=week_ago)
-
-        if not recent_stats.exists():
-            return {
-                'period': '7_days',
-                'scrapes_attempted': 0,
-                'scrapes_successful': 0,
-                'jobs_found': 0,
-                'success_rate': 0.0
-            }
-
-        total_attempted = sum(stat.scrapes_attempted for stat in recent_stats)
-        total_successful = sum(stat.scrapes_successful for stat in recent_stats)
-        total_jobs = sum(stat.jobs_found for stat in recent_stats)
+        # Totals for the last 7 days in a single aggregate query
+        week_ago = self._now.date() - timedelta(days=7)
+        totals = obj.statistics.filter(date__gte=week_ago).aggregate(
+            attempted=Coalesce(Sum('scrapes_attempted'), 0),
+            successful=Coalesce(Sum('scrapes_successful'), 0),
+            jobs=Coalesce(Sum('jobs_found'), 0)
+        )
 
-        success_rate = (total_successful / total_attempted * 100) if total_attempted > 0 else 0.0
+        total_attempted = totals['attempted']
+        success_rate = (totals['successful'] / total_attempted * 100) if total_attempted > 0 else 0.0
 
         return {
             'period': '7_days',
             'scrapes_attempted': total_attempted,
-            'scrapes_successful': total_successful,
-            'jobs_found': total_jobs,
+            'scrapes_successful': totals['successful'],
+            'jobs_found': totals['jobs'],
             'success_rate': round(success_rate, 2)
         }
 
     def get_scraping_config(self, obj) -> Dict[str, Any]:
         """Get sanitized scraping configuration."""
-        # Return public configuration only (no sensitive data)
-        config = obj.scraping_config
-
-        public_config = {
-            'scrape_frequency_hours': obj.scrape_frequency,
-            'active': obj.active,
-            'supports_pagination': config.get('pagination', {}).get('enabled', False),
-            'javascript_required': config.get('requires_javascript', False),
-            'rate_limit_delay': config.get('rate_limit', {}).get('delay_seconds', 30)
-        }
-
-        return public_config
+        # Public configuration only (no selectors or other sensitive data)
+        return obj.scraping_public_config
 
     def get_performance_metrics(self, obj) -> Dict[str, Any]:
         """Get overall performance metrics."""
-        # Get last 30 days of statistics
-        month_ago = timezone.now() - timedelta(days=30)
-        month_stats = obj.statistics.filter(date__gte=month_ago)
-
-        if not month_stats.exists():
-            return {
-                'uptime_percentage': 0.0,
-                'avg_response_time': 0.0,
-                'total_jobs_found': 0,
-                'data_quality_score': 0.0
-            }
-
-        total_days = month_stats.count()
-        successful_days = month_stats.filter(scrapes_successful__gt=0).count()
-        uptime_percentage = (successful_days / total_days * 100) if total_days > 0 else 0.0
-
-        avg_response_time = month_stats.aggregate(
-            avg_time=serializers.Avg('average_response_time')
-        )['avg_time'] or 0.0
-
-        total_jobs = sum(stat.jobs_found for stat in month_stats)
-
-        # Calculate data quality score based on completeness
-        avg_quality = month_stats.aggregate(
-            avg_quality=serializers.Avg('average_quality_score')
-        )['avg_quality'] or 0.0
+        # Every 30-day metric comes from one aggregate query
+        month_ago = self._now.date() - timedelta(days=30)
+        metrics = obj.statistics.filter(date__gte=month_ago).aggregate(
+            total_days=Count('id'),
+            successful_days=Count('id', filter=Q(scrapes_successful__gt=0)),
+            avg_response_time=Avg('average_response_time'),
+            total_jobs=Coalesce(Sum('jobs_found'), 0)
+        )
+
+        total_days = metrics['total_days']
+        uptime_percentage = (metrics['successful_days'] / total_days * 100) if total_days > 0 else 0.0
 
         return {
             'uptime_percentage': round(uptime_percentage, 2),
-            'avg_response_time': round(avg_response_time, 3),
-            'total_jobs_found': total_jobs,
-            'data_quality_score': round(avg_quality, 2)
+            'avg_response_time': round(metrics['avg_response_time'] or 0.0, 3),
+            'total_jobs_found': metrics['total_jobs'],
+            # SourceStatistics does not record data quality yet
+            'data_quality_score': 0.0
         }
 
 
-class SourceStatisticsSerializer(serializers.ModelSerializer):
+class SourceStatisticsSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for source statistics."""
 
     source_name = serializers.CharField(source='source.name', read_only=True)
@@ -169,6 +163,8 @@ class SourceStatisticsSerializer(serializers.ModelSerializer):
 class SourceConfigurationSerializer(serializers.Serializer):
     """Serializer for source configuration validation."""
 
+    # Format only; reachability is checked off the request thread by
+    # apps.scraping.tasks.test_source_configuration
     base_url = serializers.URLField(required=True)
     scrape_frequency = serializers.IntegerField(min_value=1, max_value=168)  # 1 hour to 1 week
     is_active = serializers.BooleanField(default=True)
@@ -184,20 +180,6 @@ class SourceConfigurationSerializer(serializers.Serializer):
     job_link_selector = serializers.CharField(max_length=500, required=True)
     pagination_selector = serializers.CharField(max_length=500, required=False)
 
-    def validate_base_url(self, value):
-        """Validate base URL is accessible."""
-        import requests
-        try:
-            response = requests.head(value, timeout=10)
-            if response.status_code >= 400:
-                raise serializers.ValidationError(
-                    f"URL returned status code {response.status_code}"
-                )
-        except requests.RequestException as e:
-            raise serializers.ValidationError(f"URL is not accessible: {str(e)}")
-
-        return value
-
     def validate(self, data):
         """Cross-field validation."""
         # If pagination selector is provided, ensure max_pages > 1
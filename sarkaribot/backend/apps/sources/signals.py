@@ -0,0 +1,25 @@
+"""
+Django signals for the sources app.
+"""
+
+from django.db.models.signals import post_save, post_delete
+
+from apps.core.utils import safe_signal
+from apps.core.caching import invalidate_list_cache
+from .models import GovernmentSource, SourceStatistics
+
+# Models whose API summary responses are cached
+CACHED_RESPONSE_MODELS = (GovernmentSource, SourceStatistics)
+
+
+@safe_signal('invalidate_sources_cache')
+def invalidate_sources_cache(sender, **kwargs):
+    """
+    Drop cached summary responses when a source or statistics row changes.
+    """
+    invalidate_list_cache(sender)
+
+
+for _model in CACHED_RESPONSE_MODELS:
+    post_save.connect(invalidate_sources_cache, sender=_model)
+    post_delete.connect(invalidate_sources_cache, sender=_model)
@@ -9,13 +9,16 @@ import logging
 from typing import Dict, Any
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q, Count, Avg
+from django.db.models import Q, Count, Avg, Sum
 from django.utils import timezone
 from datetime import timedelta
 
+from apps.core.caching import CachedResponseMixin
+from .filters import SourceStatisticsFilter
 from .models import GovernmentSource, SourceStatistics
 from .serializers import (
     GovernmentSourceSerializer, GovernmentSourceDetailSerializer,
@@ -25,7 +28,28 @@ from .serializers import (
 logger = logging.getLogger(__name__)
 
 
-class GovernmentSourceViewSet(viewsets.ReadOnlyModelViewSet):
+# Summaries aggregate days of statistics that only change at scrape cadence
+SUMMARY_CACHE_TIMEOUT = 60 * 5
+
+
+class SourcesCursorPagination(CursorPagination):
+    """
+    Cursor pagination for source listings.
+
+    Pages are fetched with a keyset seek on the view's ordering instead
+    of an OFFSET, and no COUNT(*) runs over the annotated queryset. The
+    view's ordering (or ?ordering=) takes precedence over this default,
+    so orderable fields must be non-null and unique (or, like timestamps,
+    practically so) for a cursor position to identify a single row.
+    """
+
+    ordering = '-created_at'
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class GovernmentSourceViewSet(CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for government sources.
 
@@ -39,8 +63,28 @@ class GovernmentSourceViewSet(viewsets.ReadOnlyModelViewSet):
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['is_active', 'scrape_frequency']
     search_fields = ['name', 'display_name', 'description']
-    ordering_fields = ['name', 'display_name', 'created_at', 'last_scraped']
+    # last_scraped is nullable and display_name is not unique, so neither
+    # can be used as a cursor position
+    ordering_fields = ['name', 'created_at']
     ordering = ['name']
+    pagination_class = SourcesCursorPagination
+    cache_models = (GovernmentSource, SourceStatistics)
+
+    # Columns rendered by GovernmentSourceSerializer; list views skip
+    # config_json and the scraping selectors
+    LIST_ONLY_FIELDS = (
+        'id', 'name', 'display_name', 'description', 'base_url', 'is_active',
+        'scrape_frequency', 'last_scraped', 'next_scrape_at', 'last_scrape_status',
+        'created_at', 'updated_at',
+    )
+
+    # Aggregates behind every scrape performance summary
+    SUMMARY_AGGREGATES = {
+        'total_attempted': Sum('scrapes_attempted'),
+        'total_successful': Sum('scrapes_successful'),
+        'avg_jobs': Avg('jobs_found'),
+        'avg_response_time': Avg('average_response_time'),
+    }
 
     def get_serializer_class(self):
         """Return detailed serializer for detail view."""
@@ -48,6 +92,18 @@ class GovernmentSourceViewSet(viewsets.ReadOnlyModelViewSet):
             return GovernmentSourceDetailSerializer
         return GovernmentSourceSerializer
 
+    def get_queryset(self):
+        """Annotate job counts for serialization."""
+        queryset = super().get_queryset()
+
+        if self.action == 'list':
+            queryset = queryset.only(*self.LIST_ONLY_FIELDS)
+
+        if self.action in ('list', 'retrieve'):
+            queryset = queryset.annotate(jobs_count=Count('job_postings'))
+
+        return queryset
+
     @action(detail=True, methods=['get'])
     def statistics(self, request, pk=None):
         """Get detailed statistics for a specific source."""
@@ -73,32 +129,11 @@ class GovernmentSourceViewSet(viewsets.ReadOnlyModelViewSet):
     def performance_summary(self, request):
         """Get performance summary for all sources."""
         try:
-            sources = self.get_queryset()
-            summary_data = []
-
-            for source in sources:
-                # Get recent stats
-                recent_stats = SourceStatistics.objects.filter(
-                    source=source,
-                    date__gte=timezone.now() - timedelta(days=7)
-                )
-
-                summary = {
-                    'source_id': source.id,
-                    'name': source.name,
-                    'display_name': source.display_name,
-                    'active': source.active,
-                    'last_scraped': source.last_scraped,
-                    'scrape_frequency': source.scrape_frequency,
-                    'recent_performance': self._calculate_summary_stats(recent_stats)
-                }
-                summary_data.append(summary)
-
-            return Response({
-                'total_sources': len(summary_data),
-                'active_sources': len([s for s in summary_data if s['active']]),
-                'sources': summary_data
-            })
+            data = self.get_cached_data(
+                request, 'performance-summary', self._build_performance_summary,
+                timeout=SUMMARY_CACHE_TIMEOUT
+            )
+            return Response(data)
 
         except Exception as e:
             logger.error(f"Error generating performance summary: {e}")
@@ -107,36 +142,78 @@ class GovernmentSourceViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def _calculate_summary_stats(self, stats_queryset) -> Dict[str, Any]:
-        """Calculate summary statistics from queryset."""
-        if not stats_queryset.exists():
-            return {
-                'total_scrapes': 0,
-                'success_rate': 0.0,
-                'avg_jobs_found': 0.0,
-                'avg_response_time': 0.0
+    def _build_performance_summary(self) -> Dict[str, Any]:
+        """Build the performance summary payload for all listed sources."""
+        sources = self.get_queryset().only(
+            'id', 'name', 'display_name', 'is_active', 'last_scraped', 'scrape_frequency'
+        )
+
+        # Last 7 days of statistics for every source in one grouped query
+        week_ago = timezone.now().date() - timedelta(days=7)
+        stats_by_source = {
+            row['source_id']: row
+            for row in SourceStatistics.objects.filter(
+                source__in=sources.values('id'),
+                date__gte=week_ago
+            ).values('source_id').annotate(**self.SUMMARY_AGGREGATES).order_by()
+        }
+
+        summary_data = []
+        for source in sources:
+            summary = {
+                'source_id': source.id,
+                'name': source.name,
+                'display_name': source.display_name,
+                'active': source.is_active,
+                'last_scraped': source.last_scraped,
+                'scrape_frequency': source.scrape_frequency,
+                'recent_performance': self._format_summary_stats(
+                    stats_by_source.get(source.id, {})
+                )
             }
+            summary_data.append(summary)
 
-        aggregates = stats_queryset.aggregate(
-            total_attempted=Count('scrapes_attempted'),
-            total_successful=Count('scrapes_successful'),
-            avg_jobs=Avg('jobs_found'),
-            avg_response_time=Avg('average_response_time')
+        # The view only lists active sources, so the counts run over all of
+        # them for active_sources to be meaningful
+        counts = GovernmentSource.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True))
         )
 
-        total_attempted = aggregates['total_attempted'] or 0
-        total_successful = aggregates['total_successful'] or 0
+        return {
+            'total_sources': counts['total'],
+            'active_sources': counts['active'],
+            'sources': summary_data
+        }
+
+    def _calculate_summary_stats(self, stats_queryset) -> Dict[str, Any]:
+        """Calculate summary statistics from queryset."""
+        return self._format_summary_stats(stats_queryset.aggregate(**self.SUMMARY_AGGREGATES))
+
+    @staticmethod
+    def _format_summary_stats(aggregates: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Format SUMMARY_AGGREGATES results for the API.
+
+        Args:
+            aggregates: Aggregate values; missing or None values count as zero
+
+        Returns:
+            Summary statistics dictionary
+        """
+        total_attempted = aggregates.get('total_attempted') or 0
+        total_successful = aggregates.get('total_successful') or 0
         success_rate = (total_successful / total_attempted * 100) if total_attempted > 0 else 0.0
 
         return {
             'total_scrapes': total_attempted,
             'success_rate': round(success_rate, 2),
-            'avg_jobs_found': round(aggregates['avg_jobs'] or 0.0, 2),
-            'avg_response_time': round(aggregates['avg_response_time'] or 0.0, 3)
+            'avg_jobs_found': round(aggregates.get('avg_jobs') or 0.0, 2),
+            'avg_response_time': round(aggregates.get('avg_response_time') or 0.0, 3)
         }
 
 
-class SourceStatisticsViewSet(viewsets.ReadOnlyModelViewSet):
+class SourceStatisticsViewSet(CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for source statistics.
 
@@ -148,45 +225,60 @@ class SourceStatisticsViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = SourceStatisticsSerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['source', 'date']
+    filterset_class = SourceStatisticsFilter
     search_fields = ['source__name']
     ordering_fields = ['date', 'scrapes_successful', 'jobs_found']
     ordering = ['-date']
+    pagination_class = SourcesCursorPagination
+
+    # Columns rendered by SourceStatisticsSerializer, plus the source name
+    LIST_ONLY_FIELDS = (
+        'id', 'source_id', 'date', 'scrapes_attempted', 'scrapes_successful',
+        'scrapes_failed', 'jobs_found', 'jobs_updated', 'average_response_time',
+        'total_pages_scraped', 'source__name',
+    )
+
+    def get_queryset(self):
+        """Join the source name for list views instead of a query per row."""
+        queryset = super().get_queryset()
+
+        if self.action == 'list':
+            queryset = queryset.select_related('source').only(*self.LIST_ONLY_FIELDS)
+
+        return queryset
 
     @action(detail=False, methods=['get'])
     def summary(self, request):
         """Get summary statistics for all sources."""
+        data = self.get_cached_data(
+            request, 'summary', self._build_summary, timeout=SUMMARY_CACHE_TIMEOUT
+        )
+        return Response(data)
 
-        # Get last 30 days of statistics
-        thirty_days_ago = timezone.now() - timedelta(days=30)
+    def _build_summary(self) -> Dict[str, Any]:
+        """Aggregate the last 30 days of statistics across all sources."""
+        thirty_days_ago = timezone.now().date() - timedelta(days=30)
 
         summary = SourceStatistics.objects.filter(
             date__gte=thirty_days_ago
         ).aggregate(
-            total_scrapes_attempted=Count('scrapes_attempted'),
-            total_scrapes_successful=Count('scrapes_successful'),
-            total_jobs_found=Count('jobs_found'),
+            total_scrapes_attempted=Sum('scrapes_attempted'),
+            total_scrapes_successful=Sum('scrapes_successful'),
+            total_jobs_found=Sum('jobs_found'),
             avg_response_time=Avg('average_response_time')
         )
 
-        return Response({
+        return {
             'period': '30_days',
             'summary': summary
-        })
+        }
 
     @action(detail=False, methods=['get'])
     def performance(self, request):
         """Get performance metrics for all sources."""
-        from django.db.models import Count, Avg, Q
-        from datetime import timedelta
-        from django.utils import timezone
-        
-        # Get statistics for last 30 days
-        thirty_days_ago = timezone.now() - timedelta(days=30)
-        
         sources_stats = []
-        for source in self.get_queryset():
-            stats = {
+        for source in GovernmentSource.objects.with_30d_metrics():
+            sources_stats.append({
                 'source_id': source.id,
                 'source_name': source.name,
                 'display_name': source.display_name,
@@ -195,20 +287,8 @@ class SourceStatisticsViewSet(viewsets.ReadOnlyModelViewSet):
                 'total_jobs_found': source.total_jobs_found,
                 'scrape_frequency': source.scrape_frequency,
                 'status': source.status,
-            }
-            
-            # Add recent job counts if jobs app is available
-            try:
-                from apps.jobs.models import JobPosting
-                recent_jobs = JobPosting.objects.filter(
-                    source=source,
-                    created_at__gte=thirty_days_ago
-                ).count()
-                stats['recent_jobs_count'] = recent_jobs
-            except ImportError:
-                stats['recent_jobs_count'] = 0
-            
-            sources_stats.append(stats)
+                'recent_jobs_count': source.get_jobs_count_last_30_days(),
+            })
         
         return Response({
             'success': True,
@@ -15,8 +15,15 @@ app = Celery('sarkaribot')
 # the configuration object to child processes.
 app.config_from_object('django.conf:settings', namespace='CELERY')
 
-# Load task modules from all registered Django app configs.
-app.autodiscover_tasks()
+# Apps that define a tasks module. Listing them skips probing every
+# installed app for one on worker boot; add new task apps here.
+TASK_PACKAGES = [
+    'apps.core',
+    'apps.scraping',
+    'apps.seo',
+]
+
+app.autodiscover_tasks(TASK_PACKAGES)
 
 # Celery Beat Schedule for periodic tasks
 app.conf.beat_schedule = {
@@ -32,6 +39,10 @@ app.conf.beat_schedule = {
         'task': 'apps.seo.tasks.generate_sitemap',
         'schedule': 86400.0,  # Daily
     },
+    'refresh-trending-keywords': {
+        'task': 'apps.seo.tasks.refresh_trending_keywords',
+        'schedule': 600.0,  # Every 10 minutes
+    },
     'health-check': {
         'task': 'apps.core.tasks.health_check',
         'schedule': 900.0,  # Every 15 minutes
@@ -4,9 +4,10 @@ Django settings for SarkariBot project.
 Generated by Django 4.2.14 on 2025-08-01.
 """
 
+import json
 import os
 from pathlib import Path
-from decouple import config
+from decouple import Csv, config
 import logging.config
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -21,7 +22,7 @@ SECRET_KEY = config('SECRET_KEY', default='django-insecure-dev-key-change-in-pro
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = config('DEBUG', default=True, cast=bool)
 
-ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='localhost,127.0.0.1', cast=lambda v: [s.strip() for s in v.split(',')])
+ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='localhost,127.0.0.1', cast=Csv())
 
 # Application definition
 DJANGO_APPS = [
@@ -56,6 +57,8 @@ LOCAL_APPS = [
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
+# Every middleware must be async-capable so ASGI requests are served
+# without sync/async adaptation; enforced by `manage.py check --deploy`
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
@@ -107,9 +110,14 @@ else:
             'PASSWORD': config('DB_PASSWORD', default='postgres'),
             'HOST': config('DB_HOST', default='localhost'),
             'PORT': config('DB_PORT', default='5432'),
-            'OPTIONS': {
-                'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
-            },
+            # Keep connections open across requests; health checks replace
+            # connections that were dropped while idle
+            'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=600, cast=int),
+            'CONN_HEALTH_CHECKS': True,
+            # Must be True behind pgbouncer in transaction pooling mode
+            'DISABLE_SERVER_SIDE_CURSORS': config('DB_DISABLE_SERVER_SIDE_CURSORS', default=False, cast=bool),
+            # Driver options as a JSON object, e.g. {"sslmode": "require"}
+            'OPTIONS': config('DB_OPTIONS', default='', cast=lambda v: json.loads(v) if v else {}),
         }
     }
 
@@ -189,7 +197,7 @@ SPECTACULAR_SETTINGS = {
 CORS_ALLOWED_ORIGINS = config(
     'CORS_ALLOWED_ORIGINS',
     default='http://localhost:3000,http://127.0.0.1:3000',
-    cast=lambda v: [s.strip() for s in v.split(',')]
+    cast=Csv()
 )
 
 CORS_ALLOW_CREDENTIALS = True
@@ -213,11 +221,18 @@ if CACHE_ENGINE == 'dummy':
 else:
     CACHES = {
         'default': {
-            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'BACKEND': 'django_redis.cache.RedisCache',
             'LOCATION': config('CACHE_URL', default='redis://localhost:6379/1'),
             'TIMEOUT': 300,  # 5 minutes default
             'OPTIONS': {
                 'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+                # redis-py picks the C hiredis parser automatically when
+                # hiredis is installed (see requirements/base.txt)
+                'COMPRESSOR': 'django_redis.compressors.lz4.Lz4Compressor',
+                'CONNECTION_POOL_KWARGS': {
+                    'max_connections': config('CACHE_MAX_CONNECTIONS', default=50, cast=int),
+                    'retry_on_timeout': True,
+                },
             },
             'KEY_PREFIX': 'sarkaribot',
             'VERSION': 1,
@@ -225,6 +240,12 @@ else:
     }
 
 # Logging Configuration
+# logs/ is not tracked in git; create it on first run only, so later
+# imports cost one stat instead of a mkdir
+LOGS_DIR = BASE_DIR / 'logs'
+if not LOGS_DIR.is_dir():
+    LOGS_DIR.mkdir(parents=True, exist_ok=True)
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -239,10 +260,11 @@ LOGGING = {
         },
     },
     'handlers': {
+        # Writes happen on a background thread, off the request path
         'file': {
             'level': 'INFO',
-            'class': 'logging.FileHandler',
-            'filename': BASE_DIR / 'logs' / 'django.log',
+            'class': 'apps.core.log_handlers.BackgroundFileHandler',
+            'filename': LOGS_DIR / 'django.log',
             'formatter': 'verbose',
         },
         'console': {
@@ -275,11 +297,11 @@ SECURE_CONTENT_TYPE_NOSNIFF = True
 X_FRAME_OPTIONS = 'DENY'
 
 # Custom Settings
-SCRAPING_USER_AGENTS = [
+SCRAPING_USER_AGENTS = (
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
     'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-]
+)
 
 SCRAPING_DEFAULT_DELAY = 2  # seconds
 SCRAPING_MAX_RETRIES = 3
@@ -289,6 +311,8 @@ SCRAPING_TIMEOUT = 30  # seconds
 SEO_TITLE_MAX_LENGTH = 60
 SEO_DESCRIPTION_MAX_LENGTH = 160
 SEO_KEYWORDS_MAX_COUNT = 7
+# Use the spaCy pipeline for keyword extraction instead of regex tokenization
+SEO_USE_SPACY = config('SEO_USE_SPACY', default=False, cast=bool)
 
 # Government Source Configuration
 GOVERNMENT_SOURCES_CONFIG_PATH = BASE_DIR / 'config' / 'government_sources.json'
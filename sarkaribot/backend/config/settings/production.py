@@ -18,9 +18,6 @@ SECURE_HSTS_PRELOAD = True
 SESSION_COOKIE_SECURE = True
 CSRF_COOKIE_SECURE = True
 
-# Database connection pooling
-DATABASES['default']['CONN_MAX_AGE'] = 600
-
 # Static files
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
@@ -59,3 +56,5 @@ CACHES['default']['TIMEOUT'] = 3600  # 1 hour in production
 CELERY_TASK_ALWAYS_EAGER = False
 CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 CELERY_TASK_ACKS_LATE = True
+CELERY_BROKER_POOL_LIMIT = config('CELERY_BROKER_POOL_LIMIT', default=10, cast=int)
+CELERY_WORKER_PROC_ALIVE_TIMEOUT = config('CELERY_WORKER_PROC_ALIVE_TIMEOUT', default=10.0, cast=float)
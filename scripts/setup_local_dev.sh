@@ -35,22 +35,8 @@ pip install requests==2.31.0
 pip install beautifulsoup4==4.12.2
 pip install lxml==4.9.3
 
-# Install spaCy English model
-echo "📚 Installing spaCy English model..."
-python -m spacy download en_core_web_sm
-
-# Verify spaCy installation
-echo "🔍 Verifying spaCy installation..."
-python -c "
-import spacy
-try:
-    nlp = spacy.load('en_core_web_sm')
-    print('✅ spaCy English model loaded successfully')
-    print(f'   Model version: {nlp.meta.get(\"version\", \"unknown\")}')
-except Exception as e:
-    print(f'❌ spaCy model failed to load: {e}')
-    exit(1)
-"
+# The spaCy English model is optional: the SEO engine extracts keywords with
+# regex tokenization unless SEO_USE_SPACY=True (see scripts/setup_nlp.sh).
 
 # Test Django setup
 echo "🧪 Testing Django setup..."